@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Examen adaptativo
+Modelo de respuesta al ítem de dos parámetros (2PL): tras cada respuesta se
+estima la habilidad del alumno y se elige la pregunta que más información
+aporta en ese punto, hasta poder decidir si aprobaría.
+"""
+
+import bisect
+import json
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from az104_bank import Question, user_data_path
+
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy se usa la búsqueda en Python puro (mismo resultado)
+    np = None
+
+# Parámetros calibrados {clave: [discriminación, dificultad]}; sin ellos, a=1 y b=0
+PARAMETERS_FILE = 'irt_parameters.json'
+DEFAULT_DISCRIMINATION = 1.0
+DEFAULT_DIFFICULTY = 0.0
+
+PASS_RATIO = 0.70
+# Rejilla de habilidad para la estimación EAP, con prior normal estándar
+THETA_GRID = [i / 10 for i in range(-40, 41)]
+# z de un intervalo del 90%: se decide cuando el intervalo no contiene el corte
+DECISION_Z = 1.645
+MIN_ITEMS = 10
+MAX_ITEMS = 60
+
+# x²·σ(x)·σ(-x) es máxima en x ≈ 2.3994 (ver ItemPool._bound)
+_PEAK = 2.3994
+
+
+def _logistic(x: float) -> float:
+    if x < -35:
+        return 0.0
+    if x > 35:
+        return 1.0
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+def load_parameters(path: Optional[str] = None) -> Dict[str, Tuple[float, float]]:
+    """Parámetros calibrados de las preguntas; vacío si el archivo no existe o no es válido.
+
+    Las entradas que no son un par de números se ignoran.
+    """
+    try:
+        with open(path or user_data_path(PARAMETERS_FILE), encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return {}
+        parameters = {}
+        for key, value in data.items():
+            if not isinstance(value, list):
+                continue
+            try:
+                a, b = map(float, value)
+            except (TypeError, ValueError):
+                continue
+            if math.isfinite(a) and math.isfinite(b):
+                parameters[key] = (a, b)
+        return parameters
+    except (OSError, ValueError):
+        return {}
+
+
+class ItemPool:
+    """Preguntas con sus parámetros 2PL, indexadas para elegir rápido.
+
+    Con NumPy la información de todas las preguntas se calcula de una vez y
+    se toma el máximo. Sin NumPy las preguntas se ordenan por dificultad y se
+    recorren desde la más cercana a la habilidad estimada, parando cuando ni
+    la mejor discriminación posible podría superar a la mejor encontrada.
+    """
+
+    def __init__(self, questions: Sequence[Question], parameters: Optional[Dict] = None,
+                 rng: Optional[random.Random] = None):
+        parameters = parameters or {}
+        # Barajar primero hace que los empates se resuelvan al azar
+        self.questions = list(questions)
+        (rng or random).shuffle(self.questions)
+        params = [parameters.get(q.key, (DEFAULT_DISCRIMINATION, DEFAULT_DIFFICULTY))
+                  for q in self.questions]
+        self.a = [a for a, _ in params]
+        self.b = [b for _, b in params]
+        self.a_min = min(self.a, default=DEFAULT_DISCRIMINATION)
+        self.a_max = max(self.a, default=DEFAULT_DISCRIMINATION)
+
+        self.by_difficulty = sorted(range(len(self.questions)), key=self.b.__getitem__)
+        self.sorted_b = [self.b[i] for i in self.by_difficulty]
+        if np is not None:
+            self.a_array = np.array(self.a)
+            self.b_array = np.array(self.b)
+        self._cut = None
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def probability(self, i: int, theta: float) -> float:
+        """Probabilidad de acertar la pregunta ``i`` con habilidad ``theta``"""
+        return _logistic(self.a[i] * (theta - self.b[i]))
+
+    def information(self, i: int, theta: float) -> float:
+        p = self.probability(i, theta)
+        return self.a[i] * self.a[i] * p * (1 - p)
+
+    @property
+    def cut(self) -> float:
+        """Habilidad con la que se acertaría el 70% del banco (corte de aprobado)"""
+        if self._cut is None:
+            low, high = -6.0, 6.0
+            for _ in range(40):
+                mid = (low + high) / 2
+                if self.expected_score(mid) < PASS_RATIO:
+                    low = mid
+                else:
+                    high = mid
+            self._cut = (low + high) / 2
+        return self._cut
+
+    def expected_score(self, theta: float) -> float:
+        if np is not None:
+            return float(np.mean(1 / (1 + np.exp(-self.a_array * (theta - self.b_array)))))
+        return sum(self.probability(i, theta) for i in range(len(self))) / len(self)
+
+    def _bound(self, distance: float) -> float:
+        # Información máxima posible a esa distancia de la dificultad, para
+        # cualquier discriminación entre a_min y a_max
+        a = _PEAK / distance if distance > 0 else self.a_max
+        a = min(max(a, self.a_min), self.a_max)
+        p = _logistic(a * distance)
+        return a * a * p * (1 - p)
+
+    def most_informative(self, theta: float, used) -> Optional[int]:
+        """Índice de la pregunta no usada con más información en ``theta``"""
+        if np is not None:
+            p = 1 / (1 + np.exp(-self.a_array * (theta - self.b_array)))
+            info = self.a_array * self.a_array * p * (1 - p)
+            info[list(used)] = -1.0
+            best = int(np.argmax(info))
+            return None if info[best] < 0 else best
+
+        sorted_b = self.sorted_b
+        high = bisect.bisect_left(sorted_b, theta)
+        low = high - 1
+        best, best_info = None, -1.0
+        while low >= 0 or high < len(sorted_b):
+            if high >= len(sorted_b) or (low >= 0 and theta - sorted_b[low] <= sorted_b[high] - theta):
+                position, low = low, low - 1
+            else:
+                position, high = high, high + 1
+            # El margen evita recorrer empates que solo difieren por redondeo
+            if self._bound(abs(theta - sorted_b[position])) <= best_info * (1 + 1e-9):
+                break
+            i = self.by_difficulty[position]
+            if i in used:
+                continue
+            info = self.information(i, theta)
+            if info > best_info:
+                best, best_info = i, info
+        return best
+
+
+class AdaptiveExam:
+    """Un examen adaptativo en curso"""
+
+    def __init__(self, pool: ItemPool, min_items: int = MIN_ITEMS, max_items: int = MAX_ITEMS):
+        self.pool = pool
+        self.min_items = min_items
+        self.max_items = min(max_items, len(pool))
+        self.used = set()
+        self.responses: List[Tuple[Question, bool]] = []
+        # Log-posterior sobre THETA_GRID, empezando por el prior N(0, 1)
+        self.log_posterior = [-t * t / 2 for t in THETA_GRID]
+        self.theta = 0.0
+        self.se = 1.0
+        self._current = None
+
+    def next_question(self) -> Optional[Question]:
+        """Siguiente pregunta, o None si el examen ya terminó"""
+        if self.finished:
+            return None
+        self._current = self.pool.most_informative(self.theta, self.used)
+        if self._current is None:
+            return None
+        self.used.add(self._current)
+        return self.pool.questions[self._current]
+
+    def record(self, correct: bool) -> None:
+        """Registra la respuesta a la última pregunta y actualiza la estimación"""
+        i = self._current
+        self.responses.append((self.pool.questions[i], correct))
+        for j, t in enumerate(THETA_GRID):
+            p = self.pool.probability(i, t)
+            self.log_posterior[j] += math.log(max(p if correct else 1 - p, 1e-300))
+
+        top = max(self.log_posterior)
+        weights = [math.exp(lp - top) for lp in self.log_posterior]
+        total = sum(weights)
+        self.theta = sum(w * t for w, t in zip(weights, THETA_GRID)) / total
+        self.se = math.sqrt(sum(w * (t - self.theta) ** 2 for w, t in zip(weights, THETA_GRID)) / total)
+
+    @property
+    def correct(self) -> int:
+        return sum(1 for _, correct in self.responses if correct)
+
+    @property
+    def decision(self) -> Optional[bool]:
+        """True/False si ya se puede decidir aprobado/no aprobado; None si no"""
+        cut = self.pool.cut
+        if len(self.responses) >= self.min_items:
+            if self.theta - DECISION_Z * self.se > cut:
+                return True
+            if self.theta + DECISION_Z * self.se < cut:
+                return False
+        if len(self.responses) >= self.max_items:
+            return self.theta >= cut
+        return None
+
+    @property
+    def finished(self) -> bool:
+        return self.decision is not None or len(self.used) >= len(self.pool)
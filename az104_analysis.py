@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Análisis de preguntas
+A partir del historial de respuestas calcula, para cada pregunta, su
+dificultad (p: proporción de aciertos), su discriminación (correlación
+punto-biserial entre acertarla y el resultado en el resto de la sesión) y la
+frecuencia con que se elige cada opción, y señala las preguntas sospechosas:
+demasiado fáciles o difíciles, que no discriminan o con posible clave errónea.
+
+Uso:
+    python3 az104_analysis.py                # informe en texto
+    python3 az104_analysis.py --json         # el mismo análisis en JSON
+    python3 az104_analysis.py --write-irt    # guarda parámetros para el examen adaptativo
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from array import array
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+from az104_adaptive import PARAMETERS_FILE
+from az104_attempts import AttemptLog
+from az104_bank import BANK, LETTERS, user_data_path
+
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy se agregan las mismas columnas en Python puro
+    np = None
+
+# Respuestas mínimas para que los indicadores de una pregunta sean fiables
+MIN_RESPONSES = 30
+EASY_P = 0.90
+HARD_P = 0.20
+LOW_DISCRIMINATION = 0.10
+
+_NORMAL = NormalDist()
+
+
+class ItemStats:
+    """Indicadores de una pregunta"""
+    __slots__ = ('key', 'responses', 'correct', 'discrimination', 'options', 'flags')
+
+    def __init__(self, key: str, responses: int, correct: int, discrimination: Optional[float],
+                 options: List[int]):
+        self.key = key
+        self.responses = responses
+        self.correct = correct
+        self.discrimination = discrimination
+        # Veces que se marcó cada opción (en las de selección múltiple, cada una cuenta)
+        self.options = options
+        self.flags: List[str] = []
+
+    @property
+    def p_value(self) -> float:
+        return self.correct / self.responses if self.responses else 0.0
+
+    def to_dict(self) -> Dict:
+        question = BANK.get(self.key)
+        return {
+            'key': self.key,
+            'topic': question.topic if question else None,
+            'responses': self.responses,
+            'p_value': round(self.p_value, 4),
+            'discrimination': None if self.discrimination is None else round(self.discrimination, 4),
+            'options': {LETTERS[i]: count for i, count in enumerate(self.options)},
+            'answer': question.answer_letters() if question else None,
+            'flags': self.flags,
+        }
+
+
+class ResponseColumns:
+    """Respuestas en columnas (una por campo) con las preguntas numeradas"""
+
+    def __init__(self, rows):
+        self.keys: List[str] = []
+        index = {}
+        self.sessions = array('q')
+        self.items = array('l')
+        self.selected = array('l')
+        self.correct = array('b')
+        for session, key, selected, correct in rows:
+            item = index.get(key)
+            if item is None:
+                item = index[key] = len(self.keys)
+                self.keys.append(key)
+            self.sessions.append(session)
+            self.items.append(item)
+            self.selected.append(selected)
+            self.correct.append(correct)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def _sums_numpy(columns: ResponseColumns):
+    """Sumas por pregunta con bincount sobre las columnas"""
+    size = len(columns.keys)
+    sessions = np.frombuffer(columns.sessions, dtype=np.int64)
+    items = np.frombuffer(columns.items, dtype=np.dtype(f'i{columns.items.itemsize}'))
+    selected = np.frombuffer(columns.selected, dtype=np.dtype(f'i{columns.selected.itemsize}'))
+    correct = np.frombuffer(columns.correct, dtype=np.int8).astype(np.float64)
+
+    _, session_index = np.unique(sessions, return_inverse=True)
+    session_n = np.bincount(session_index)[session_index]
+    session_correct = np.bincount(session_index, weights=correct)[session_index]
+    # Resultado en el resto de la sesión (sin contar la propia pregunta)
+    paired = session_n > 1
+    rest = np.where(paired, (session_correct - correct) / np.maximum(session_n - 1, 1), 0.0)
+
+    def by_item(weights=None, mask=None):
+        if mask is None:
+            return np.bincount(items, weights=weights, minlength=size)
+        return np.bincount(items[mask], weights=None if weights is None else weights[mask], minlength=size)
+
+    x, y = correct, rest
+    sums = {
+        'responses': by_item(),
+        'correct': by_item(correct),
+        'n': by_item(mask=paired),
+        'sx': by_item(x, paired),
+        'sy': by_item(y, paired),
+        'sxy': by_item(x * y, paired),
+        'syy': by_item(y * y, paired),
+        'options': [by_item(((selected >> bit) & 1).astype(np.float64)) for bit in range(len(LETTERS))],
+    }
+    return {name: ([v.tolist() for v in value] if name == 'options' else value.tolist())
+            for name, value in sums.items()}
+
+
+def _sums_python(columns: ResponseColumns):
+    """Las mismas sumas que _sums_numpy, recorriendo las columnas en Python"""
+    size = len(columns.keys)
+    session_n = {}
+    session_correct = {}
+    for session, correct in zip(columns.sessions, columns.correct):
+        session_n[session] = session_n.get(session, 0) + 1
+        session_correct[session] = session_correct.get(session, 0) + correct
+
+    sums = {name: [0] * size for name in ('responses', 'correct', 'n', 'sx', 'sy', 'sxy', 'syy')}
+    options = [[0] * size for _ in LETTERS]
+    responses, hits, n, sx, sy, sxy, syy = (sums[name] for name in
+                                            ('responses', 'correct', 'n', 'sx', 'sy', 'sxy', 'syy'))
+    bits = list(enumerate(options))
+    for session, item, selected, correct in zip(columns.sessions, columns.items,
+                                                columns.selected, columns.correct):
+        responses[item] += 1
+        hits[item] += correct
+        for bit, counts in bits:
+            if selected >> bit & 1:
+                counts[item] += 1
+        others = session_n[session] - 1
+        if others:
+            rest = (session_correct[session] - correct) / others
+            n[item] += 1
+            sx[item] += correct
+            sy[item] += rest
+            sxy[item] += correct * rest
+            syy[item] += rest * rest
+    sums['options'] = options
+    return sums
+
+
+def analyze(columns: ResponseColumns, min_responses: int = MIN_RESPONSES) -> List[ItemStats]:
+    """Indicadores de cada pregunta respondida, en el orden del banco"""
+    sums = _sums_numpy(columns) if np is not None else _sums_python(columns)
+
+    items = []
+    for i, key in enumerate(columns.keys):
+        n, sx, sy = sums['n'][i], sums['sx'][i], sums['sy'][i]
+        # Correlación de Pearson entre acierto (0/1) y resto de la sesión
+        spread = (n * sx - sx * sx) * (n * sums['syy'][i] - sy * sy)
+        r = (n * sums['sxy'][i] - sx * sy) / math.sqrt(spread) if spread > 0 else None
+        item = ItemStats(key, int(sums['responses'][i]), int(sums['correct'][i]), r,
+                         [int(counts[i]) for counts in sums['options']])
+        item.flags = review_flags(item, min_responses)
+        items.append(item)
+
+    order = {q.key: q.index for q in BANK.questions}
+    items.sort(key=lambda item: order.get(item.key, len(order)))
+    return items
+
+
+def review_flags(item: ItemStats, min_responses: int = MIN_RESPONSES) -> List[str]:
+    """Motivos para revisar una pregunta (vacío si parece correcta)"""
+    if item.responses < min_responses:
+        return []
+    flags = []
+    question = BANK.get(item.key)
+    if question is not None:
+        keyed = set(question.answer_letters())
+        best_key = max(item.options[LETTERS.index(letter)] for letter in keyed)
+        best_distractor = max((count for letter, count in zip(LETTERS, item.options)
+                               if letter not in keyed), default=0)
+        # Si los que mejor lo hacen eligen otra opción, la clave puede estar mal
+        weak = item.discrimination is None or item.discrimination < LOW_DISCRIMINATION
+        if best_distractor > best_key and weak:
+            flags.append('posible clave errónea')
+    if item.p_value >= EASY_P:
+        flags.append('muy fácil')
+    elif item.p_value <= HARD_P:
+        flags.append('muy difícil')
+    if item.discrimination is not None:
+        if item.discrimination < 0:
+            flags.append('discriminación negativa')
+        elif item.discrimination < LOW_DISCRIMINATION:
+            flags.append('discrimina poco')
+    return flags
+
+
+def irt_parameters(items: List[ItemStats], min_responses: int = MIN_RESPONSES) -> Dict[str, Tuple[float, float]]:
+    """Parámetros 2PL aproximados a partir de p y la punto-biserial (Lord, 1980)"""
+    parameters = {}
+    for item in items:
+        p = item.p_value
+        if item.responses < min_responses or item.discrimination is None or not 0 < p < 1:
+            continue
+        # Punto-biserial -> biserial, y de ahí discriminación y dificultad
+        z = _NORMAL.inv_cdf(p)
+        biserial = item.discrimination * math.sqrt(p * (1 - p)) / _NORMAL.pdf(z)
+        if biserial <= 0.05:
+            continue
+        biserial = min(biserial, 0.95)
+        a = 1.7 * biserial / math.sqrt(1 - biserial * biserial)
+        b = -z / biserial
+        parameters[item.key] = (round(min(max(a, 0.2), 3.0), 3), round(min(max(b, -4.0), 4.0), 3))
+    return parameters
+
+
+def print_report(items: List[ItemStats], columns: ResponseColumns, elapsed: float,
+                 min_responses: int = MIN_RESPONSES) -> None:
+    sessions = len(set(columns.sessions))
+    engine = 'NumPy' if np is not None else 'Python'
+    print(f"Respuestas analizadas: {len(columns)} en {sessions} sesiones ({elapsed:.2f} s, {engine})")
+    print(f"Los avisos solo se calculan con al menos {min_responses} respuestas por pregunta.\n")
+    print(f"{'Pregunta':16} {'N':>7} {'p':>5} {'r_pb':>6}  {'A':>5} {'B':>5} {'C':>5} {'D':>5}  Avisos")
+    print("-" * 90)
+
+    # Primero las que tienen avisos
+    for item in sorted(items, key=lambda item: not item.flags):
+        question = BANK.get(item.key)
+        keyed = set(question.answer_letters()) if question else set()
+        options = ''.join(f" {count / item.responses * 100:4.0f}{'*' if letter in keyed else ' '}"
+                          for letter, count in zip(LETTERS, item.options))
+        r = '   -  ' if item.discrimination is None else f"{item.discrimination:6.2f}"
+        print(f"{item.key:16} {item.responses:7} {item.p_value:5.2f} {r} {options}  {', '.join(item.flags)}")
+
+    print("\n* = opción correcta. Las columnas A-D son el % de respuestas que marcaron cada opción.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Análisis de las preguntas del simulador AZ-104")
+    parser.add_argument('--db', help="historial de respuestas (por defecto, el del usuario)")
+    parser.add_argument('--json', action='store_true', help="escribe el análisis en JSON")
+    parser.add_argument('--min-responses', type=int, default=MIN_RESPONSES,
+                        help="respuestas mínimas para señalar una pregunta")
+    parser.add_argument('--write-irt', action='store_true',
+                        help=f"guarda los parámetros IRT estimados en {PARAMETERS_FILE}")
+    args = parser.parse_args(argv)
+
+    log = AttemptLog(args.db)
+    started = time.perf_counter()
+    columns = ResponseColumns(log.responses())
+    items = analyze(columns, args.min_responses)
+    elapsed = time.perf_counter() - started
+
+    if args.write_irt:
+        parameters = irt_parameters(items, args.min_responses)
+        with open(user_data_path(PARAMETERS_FILE), 'w', encoding='utf-8') as f:
+            json.dump(parameters, f, indent=1)
+        print(f"Parámetros IRT de {len(parameters)} preguntas guardados en {PARAMETERS_FILE}",
+              file=sys.stderr)
+
+    if args.json:
+        json.dump({
+            'responses': len(columns),
+            'sessions': len(set(columns.sessions)),
+            'items': [item.to_dict() for item in items],
+        }, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    elif not items:
+        print("Todavía no hay respuestas registradas.")
+    else:
+        print_report(items, columns, elapsed, args.min_responses)
+
+
+if __name__ == "__main__":
+    main()
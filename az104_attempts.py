@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Registro de intentos
+Guarda cada respuesta (sesión, pregunta, opciones marcadas, acierto, hora y
+latencia) en SQLite en modo WAL. Las respuestas se escriben por lotes y los
+totales por pregunta se mantienen al día en la misma transacción, de modo que
+las estadísticas no tienen que recorrer el historial completo.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from az104_bank import Question, user_data_path
+
+ATTEMPTS_DB = 'attempts.sqlite3'
+
+# Respuestas que se acumulan en memoria antes de escribirlas
+BATCH_SIZE = 20
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS sessions '
+    '(id INTEGER PRIMARY KEY, mode TEXT NOT NULL, client TEXT NOT NULL, started REAL NOT NULL, '
+    'finished REAL, correct INTEGER, total INTEGER)',
+    'CREATE TABLE IF NOT EXISTS answers '
+    '(id INTEGER PRIMARY KEY, session INTEGER NOT NULL, ts REAL NOT NULL, key TEXT NOT NULL, '
+    'topic TEXT NOT NULL, selected INTEGER NOT NULL, correct INTEGER NOT NULL, latency REAL)',
+    'CREATE INDEX IF NOT EXISTS answers_session ON answers (session)',
+    'CREATE INDEX IF NOT EXISTS answers_key ON answers (key)',
+    'CREATE TABLE IF NOT EXISTS question_totals '
+    '(key TEXT PRIMARY KEY, topic TEXT NOT NULL, answered INTEGER NOT NULL, correct INTEGER NOT NULL)',
+)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Percentil ``q`` (0-100) de una lista ya ordenada, interpolando entre vecinos"""
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def latency_by_topic(answers: Iterable[Tuple[str, Optional[float]]]) -> Dict[str, Tuple[float, float]]:
+    """Mediana y percentil 90 del tiempo de respuesta (segundos) por tema.
+
+    Recibe pares (tema, latencia); las respuestas sin latencia se ignoran.
+    """
+    samples = {}
+    for topic, latency in answers:
+        if latency is not None:
+            samples.setdefault(topic, []).append(latency)
+    summary = {}
+    for topic, values in samples.items():
+        values.sort()
+        summary[topic] = (percentile(values, 50), percentile(values, 90))
+    return summary
+
+
+class AttemptLog:
+    """Historial de respuestas de todas las sesiones"""
+
+    def __init__(self, path: Optional[str] = None, batch_size: int = BATCH_SIZE):
+        self.path = path or user_data_path(ATTEMPTS_DB)
+        self.batch_size = batch_size
+        self._pending = []
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            for statement in _SCHEMA:
+                self.conn.execute(statement)
+
+    def start_session(self, mode: str, client: str = 'cli') -> int:
+        """Abre una sesión (práctica, examen...) y devuelve su id"""
+        with self._lock, self.conn:
+            cursor = self.conn.execute('INSERT INTO sessions (mode, client, started) VALUES (?, ?, ?)',
+                                       (mode, client, time.time()))
+        return cursor.lastrowid
+
+    def record(self, session: int, question: Question, selected: int, correct: bool,
+               latency: Optional[float] = None) -> None:
+        """Anota una respuesta; se escribe junto con las siguientes del lote"""
+        with self._lock:
+            self._pending.append((session, time.time(), question.key, question.topic,
+                                  selected, int(correct), latency))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def finish_session(self, session: int, correct: int, total: int) -> None:
+        with self._lock:
+            self._flush()
+            with self.conn:
+                self.conn.execute('UPDATE sessions SET finished = ?, correct = ?, total = ? WHERE id = ?',
+                                  (time.time(), correct, total, session))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        with self.conn:
+            self.conn.executemany('INSERT INTO answers (session, ts, key, topic, selected, correct, latency) '
+                                  'VALUES (?, ?, ?, ?, ?, ?, ?)', batch)
+            self.conn.executemany('INSERT INTO question_totals VALUES (?, ?, 1, ?) '
+                                  'ON CONFLICT (key) DO UPDATE SET answered = answered + 1, '
+                                  'correct = correct + excluded.correct',
+                                  [(key, topic, correct) for _, _, key, topic, _, correct, _ in batch])
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Consultas para las estadísticas (leen solo los totales y los índices)
+
+    def responses(self) -> sqlite3.Cursor:
+        """Todas las respuestas como filas (sesión, clave, opciones marcadas, acierto)"""
+        self.flush()
+        return self.conn.execute('SELECT session, key, selected, correct FROM answers')
+
+    def totals(self) -> Tuple[int, int, int]:
+        """(sesiones terminadas, respuestas, aciertos)"""
+        sessions = self.conn.execute('SELECT COUNT(*) FROM sessions WHERE finished IS NOT NULL').fetchone()[0]
+        answered, correct = self.conn.execute(
+            'SELECT COALESCE(SUM(answered), 0), COALESCE(SUM(correct), 0) FROM question_totals').fetchone()
+        return sessions, answered, correct
+
+    def topic_totals(self) -> List[Tuple[str, int, int]]:
+        """(tema, respuestas, aciertos) por tema"""
+        return self.conn.execute('SELECT topic, SUM(answered), SUM(correct) FROM question_totals '
+                                 'GROUP BY topic').fetchall()
+
+    def recent_sessions(self, limit: int = 10) -> List[Tuple]:
+        """(modo, inicio, fin, aciertos, total) de las últimas sesiones terminadas"""
+        return self.conn.execute('SELECT mode, started, finished, correct, total FROM sessions '
+                                 'WHERE finished IS NOT NULL ORDER BY id DESC LIMIT ?', (limit,)).fetchall()
+
+    def weakest_questions(self, limit: int = 5, min_answered: int = 3) -> List[Tuple[str, int, int]]:
+        """(clave, respuestas, aciertos) de las preguntas con peor tasa de acierto"""
+        return self.conn.execute('SELECT key, answered, correct FROM question_totals WHERE answered >= ? '
+                                 'ORDER BY CAST(correct AS REAL) / answered, answered DESC LIMIT ?',
+                                 (min_answered, limit)).fetchall()
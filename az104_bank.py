@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+AZ-104 Microsoft Azure Administrator - Banco de Preguntas
+Fuente única de preguntas para las versiones CLI, GUI y Web
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import random
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Letras de las opciones, en el orden en que se muestran
+LETTERS = ('A', 'B', 'C', 'D')
+
+# Bit de cada letra en una máscara de respuesta: A=1, B=2, C=4, D=8
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(LETTERS)}
+
+# ============================================================================
+# BANCO DE PREGUNTAS - Estilo Examen Real AZ-104
+# Basado en Microsoft Learn Study Guide (Abril 2025)
+#
+# Las preguntas viven en az104_questions.jsonl (JSON Lines): una cabecera con
+# el formato y su versión, una línea por tema y una línea por pregunta. Las
+# opciones se escriben sin la letra y la respuesta es el índice de la opción
+# correcta (o la lista de índices en preguntas de selección múltiple).
+# ============================================================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BANK_FILE = os.path.join(BASE_DIR, 'az104_questions.jsonl')
+BANK_FORMAT = 'az104-question-bank'
+BANK_FORMAT_VERSION = 1
+
+# Caché compilada del banco, junto a los .pyc salvo que se indique otra carpeta
+CACHE_DIR = os.environ.get('AZ104_CACHE_DIR') or os.path.join(BASE_DIR, '__pycache__')
+
+
+# Datos del alumno (repasos, historial), fuera de la carpeta del programa
+DATA_DIR = os.environ.get('AZ104_DATA_DIR') or os.path.join(os.path.expanduser('~'), '.az104')
+
+
+class BankFormatError(ValueError):
+    """El archivo del banco no tiene el formato esperado"""
+
+
+def indices_mask(selection: Union[None, int, Iterable[int]]) -> int:
+    """Codifica una selección por índices (0, [0, 2] o None) como máscara de bits"""
+    if selection is None:
+        return 0
+    if isinstance(selection, int):
+        return 1 << selection
+    mask = 0
+    for i in selection:
+        mask |= 1 << i
+    return mask
+
+
+def letters_mask(selection: Union[str, Iterable[str]]) -> int:
+    """Codifica una selección por letras ('C' o ['A', 'C']) como máscara de bits"""
+    mask = 0
+    for letter in selection:
+        mask |= LETTER_BITS[letter]
+    return mask
+
+
+def parse_percentage(text: str) -> float:
+    """Peso de un dominio a partir de su porcentaje ("20-25%" -> 22.5)"""
+    try:
+        bounds = [float(part) for part in text.replace('%', '').split('-')]
+    except (AttributeError, ValueError):
+        return 0.0
+    return sum(bounds) / len(bounds)
+
+
+def grade(question: 'Question', mask: int) -> bool:
+    """Corrige una respuesta ya codificada como máscara de bits"""
+    return mask == question.answer_mask
+
+
+class Question:
+    """Pregunta del banco (registro compacto e inmutable en la práctica)"""
+    __slots__ = ('topic', 'id', 'key', 'index', 'type', 'question', 'options', 'answer',
+                 'answer_mask', 'explanation')
+
+    def __init__(self, topic: str, index: int, data: Dict):
+        self.topic = sys.intern(topic)
+        self.id = data['id']
+        # Los ids solo son únicos dentro de un tema
+        self.key = sys.intern(f"{topic}-{data['id']}")
+        # Posición en BANK.questions
+        self.index = index
+        self.type = sys.intern(data['type'])
+        self.question = data['question']
+        self.options = tuple(sys.intern(option) for option in data['options'])
+        answer = data['answer']
+        self.answer = answer if isinstance(answer, int) else tuple(answer)
+        # Codificación canónica de la respuesta: corregir es comparar dos enteros
+        self.answer_mask = indices_mask(self.answer)
+        self.explanation = data['explanation']
+
+    @property
+    def is_multiple(self) -> bool:
+        return self.type == 'multiple'
+
+    def answer_letters(self) -> List[str]:
+        """Letras de la(s) respuesta(s) correcta(s)"""
+        if isinstance(self.answer, int):
+            return [LETTERS[self.answer]]
+        return [LETTERS[i] for i in self.answer]
+
+    def to_dict(self) -> Dict:
+        """Representación como diccionario, con el mismo formato del banco original"""
+        return {
+            'id': self.id,
+            'type': self.type,
+            'question': self.question,
+            'options': list(self.options),
+            'answer': self.answer if isinstance(self.answer, int) else list(self.answer),
+            'explanation': self.explanation,
+        }
+
+    def __repr__(self):
+        return f"<Question {self.key}>"
+
+
+class Topic:
+    """Dominio del examen con sus preguntas"""
+    __slots__ = ('key', 'name', 'percentage', 'weight', 'icon', 'color', 'questions')
+
+    def __init__(self, key: str, data: Dict, questions: Tuple[Question, ...]):
+        self.key = sys.intern(key)
+        self.name = sys.intern(data['name'])
+        self.percentage = data['percentage']
+        # Peso del dominio en el examen real (punto medio del rango)
+        self.weight = parse_percentage(self.percentage)
+        self.icon = data.get('icon', '')
+        self.color = data.get('color', '#4A90D9')
+        self.questions = questions
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'percentage': self.percentage,
+            'icon': self.icon,
+            'color': self.color,
+            'questions': [q.to_dict() for q in self.questions],
+        }
+
+    def __repr__(self):
+        return f"<Topic {self.key} ({len(self.questions)} preguntas)>"
+
+
+class QuestionBank:
+    """Banco de preguntas con índices por tema y por clave.
+
+    ``version`` se incrementa cada vez que se cargan preguntas nuevas, para
+    que quien guarde datos derivados (p. ej. páginas renderizadas) sepa
+    cuándo reconstruirlos. ``digest`` es el hash del archivo de origen.
+    """
+
+    def __init__(self, source: Dict, digest: str = ''):
+        self.version = 0
+        self.path = None
+        # (fecha de modificación, tamaño) del archivo cuando se leyó
+        self.stamp = None
+        self.load(source, digest)
+
+    @classmethod
+    def from_file(cls, path: str = BANK_FILE, use_cache: bool = True) -> 'QuestionBank':
+        stamp = _stamp(path)
+        bank = cls(*load_source(path, use_cache))
+        bank.path = path
+        bank.stamp = stamp
+        return bank
+
+    def reload(self, use_cache: bool = True) -> bool:
+        """Vuelve a leer el archivo de origen si se modificó; devuelve True si cambió"""
+        stamp = _stamp(self.path)
+        if stamp == self.stamp:
+            return False
+        # Un archivo inválido no se vuelve a leer hasta que cambie otra vez
+        self.stamp = stamp
+        source, digest = load_source(self.path, use_cache)
+        if digest == self.digest:
+            return False
+        self.load(source, digest)
+        return True
+
+    def load(self, source: Dict, digest: str = '') -> None:
+        """Reemplaza el contenido del banco a partir de un diccionario por temas"""
+        topics = {}
+        questions = []
+        for topic_key, topic_data in source.items():
+            topic_questions = tuple(
+                Question(topic_key, len(questions) + i, q)
+                for i, q in enumerate(topic_data['questions'])
+            )
+            questions.extend(topic_questions)
+            topics[topic_key] = Topic(topic_key, topic_data, topic_questions)
+
+        # Se asignan al final para que los lectores no vean un banco a medias
+        self.topics: Dict[str, Topic] = topics
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        self.by_key: Dict[str, Question] = {q.key: q for q in questions}
+        self.by_topic: Dict[str, Tuple[Question, ...]] = {key: t.questions for key, t in topics.items()}
+        self.digest = digest
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.questions)
+
+    def get(self, key: str) -> Optional[Question]:
+        """Busca una pregunta por su clave (``tema-id``)"""
+        return self.by_key.get(key)
+
+    def blueprint(self, count: int) -> Dict[str, int]:
+        """Cuántas preguntas de cada tema lleva un examen de ``count`` preguntas.
+
+        Reparte según el peso de cada dominio por el método del mayor resto;
+        si un tema no tiene preguntas suficientes, lo que falta se reparte
+        entre los demás en la misma proporción.
+        """
+        available = {key: len(t.questions) for key, t in self.topics.items() if t.questions}
+        weights = {key: self.topics[key].weight for key in available}
+        if not any(weights.values()):
+            weights = dict.fromkeys(available, 1.0)
+        quotas = dict.fromkeys(available, 0)
+        remaining = min(count, sum(available.values()))
+        pending = [key for key in available if weights[key] > 0]
+
+        while remaining and pending:
+            total = sum(weights[key] for key in pending)
+            shares = {key: remaining * weights[key] / total for key in pending}
+            full = [key for key in pending if shares[key] >= available[key]]
+            if full:
+                for key in full:
+                    quotas[key] = available[key]
+                    remaining -= available[key]
+                    pending.remove(key)
+                continue
+            for key in pending:
+                quotas[key] = int(shares[key])
+                remaining -= quotas[key]
+            by_remainder = sorted(pending, key=lambda key: shares[key] - quotas[key], reverse=True)
+            for key in by_remainder[:remaining]:
+                quotas[key] += 1
+            remaining = 0
+        return quotas
+
+    def sample_exam(self, count: int, rng: Optional[random.Random] = None) -> List[Question]:
+        """Preguntas para un examen, repartidas por tema según ``blueprint``.
+
+        Se eligen índices dentro de cada tema, así que el coste depende del
+        tamaño del examen y no del banco. Con un ``random.Random(semilla)`` el
+        examen es reproducible.
+        """
+        rng = rng or random
+        drawn = []
+        for key, quota in self.blueprint(count).items():
+            pool = self.by_topic[key]
+            drawn.extend(pool[i] for i in rng.sample(range(len(pool)), quota))
+        rng.shuffle(drawn)
+        return drawn
+
+    def as_dict(self) -> Dict:
+        """El banco con el formato anidado original (para exportar como JSON)"""
+        return {key: topic.to_dict() for key, topic in self.topics.items()}
+
+
+def user_data_path(name: str) -> str:
+    """Ruta de un archivo de datos del alumno, creando DATA_DIR si hace falta"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, name)
+
+
+def parse_bank(data: bytes) -> Dict:
+    """Convierte el contenido de un archivo JSON Lines en el diccionario por temas"""
+    lines = data.decode('utf-8').splitlines()
+    try:
+        header = json.loads(lines[0]) if lines else None
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get('format') != BANK_FORMAT:
+        raise BankFormatError("falta la cabecera del banco de preguntas")
+    if header.get('version') != BANK_FORMAT_VERSION:
+        raise BankFormatError(f"versión de formato no soportada: {header.get('version')}")
+
+    source = {}
+    for number, line in enumerate(lines[1:], 2):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            kind = record.pop('kind')
+            if kind == 'topic':
+                topic = source.setdefault(record.pop('key'), {'questions': []})
+                topic.update(record)
+            elif kind == 'question':
+                source[record.pop('topic')]['questions'].append(record)
+            else:
+                raise BankFormatError(f"línea {number}: tipo de registro desconocido: {kind}")
+        except (json.JSONDecodeError, KeyError, AttributeError) as e:
+            raise BankFormatError(f"línea {number}: registro inválido ({e})") from None
+    return source
+
+
+def dump_bank(source: Dict) -> str:
+    """Serializa un diccionario por temas en el formato JSON Lines del banco"""
+    lines = [{'format': BANK_FORMAT, 'version': BANK_FORMAT_VERSION}]
+    for key, topic in source.items():
+        lines.append(dict({'kind': 'topic', 'key': key},
+                          **{k: v for k, v in topic.items() if k != 'questions'}))
+    for key, topic in source.items():
+        for q in topic['questions']:
+            lines.append(dict({'kind': 'question', 'topic': key}, **q))
+    return ''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines)
+
+
+def _cache_path(path: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    # Como en los .pyc, marshal depende de la versión del intérprete
+    tag = sys.implementation.cache_tag or 'py'
+    return os.path.join(CACHE_DIR, f"{name}.v{BANK_FORMAT_VERSION}.{tag}.marshal")
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_source(path: str = BANK_FILE, use_cache: bool = True) -> Tuple[Dict, str]:
+    """Lee el banco y devuelve (diccionario por temas, hash SHA-256 del archivo).
+
+    El resultado se guarda con marshal en CACHE_DIR junto con el hash, el
+    tamaño y la fecha de modificación del archivo. Igual que con los .pyc,
+    si el archivo no ha cambiado los siguientes arranques leen la caché sin
+    volver a leer ni interpretar el JSON.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = _cache_path(path)
+
+    if use_cache:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_stamp, digest, source = marshal.loads(f.read())
+            if cached_stamp == stamp:
+                return source, digest
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    source = parse_bank(data)
+    if use_cache:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(marshal.dumps((stamp, digest, source)))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Sin caché (p. ej. carpeta de solo lectura) el banco funciona igual
+    return source, digest
+
+
+BANK = QuestionBank.from_file(BANK_FILE)
+
+
+def deep_sizeof(obj, seen=None, strings=True) -> int:
+    """Tamaño aproximado en bytes de un objeto y todo lo que referencia.
+
+    Con ``strings=False`` no cuenta las cadenas, para medir solo la estructura.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, str) and not strings:
+        return 0
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen, strings) + deep_sizeof(v, seen, strings)
+                    for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen, strings) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(deep_sizeof(getattr(obj, name), seen, strings)
+                    for name in obj.__slots__ if hasattr(obj, name))
+    return size
+
+
+def memory_report(bank: QuestionBank = BANK) -> Dict[str, int]:
+    """Compara la memoria del banco compacto con los diccionarios anidados de antes.
+
+    Antes cada versión (CLI, GUI y Web) tenía su propia copia del banco como
+    diccionarios anidados, así que el coste anterior se estima con tres copias.
+    Los textos se cuentan aparte porque ocupan lo mismo en ambos formatos.
+    """
+    # Incluye los índices: son parte de lo que el banco mantiene en memoria
+    compact = (bank.topics, bank.questions, bank.by_key, bank.by_topic)
+    legacy = bank.as_dict()
+    return {
+        'questions': len(bank),
+        'compact_bytes': deep_sizeof(compact),
+        'compact_structure_bytes': deep_sizeof(compact, strings=False),
+        'legacy_bytes': deep_sizeof(legacy),
+        'legacy_structure_bytes': deep_sizeof(legacy, strings=False),
+        'legacy_copies': 3,
+    }
+
+
+def print_memory_report() -> None:
+    report = memory_report()
+    copies = report['legacy_copies']
+    kb = lambda n: f"{n / 1024:8.1f} KB"
+    print(f"Preguntas en el banco: {report['questions']}\n")
+    print(f"{'':34}{'Total':>11}{'Estructura':>11}")
+    print(f"{'Registros compactos (1 copia)':34}{kb(report['compact_bytes'])}"
+          f"{kb(report['compact_structure_bytes'])}")
+    print(f"{'Diccionarios anidados (1 copia)':34}{kb(report['legacy_bytes'])}"
+          f"{kb(report['legacy_structure_bytes'])}")
+    print(f"{f'Diccionarios anidados ({copies} copias)':34}{kb(report['legacy_bytes'] * copies)}"
+          f"{kb(report['legacy_structure_bytes'] * copies)}")
+
+
+if __name__ == "__main__":
+    print_memory_report()
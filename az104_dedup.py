@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Detección de preguntas casi duplicadas
+Cada pregunta se reduce al conjunto de sus 3-gramas de palabras (enunciado y
+opciones) y a una firma MinHash; las firmas se agrupan por bandas (LSH), de
+modo que solo se comparan las parejas que coinciden en alguna banda. El coste
+crece de forma casi lineal con el tamaño del banco, en lugar de comparar todas
+las parejas.
+
+Uso:
+    python3 az104_dedup.py                   # grupos con similitud >= 0.7
+    python3 az104_dedup.py --threshold 0.5   # más permisivo
+    python3 az104_dedup.py --json
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from az104_bank import BANK_FILE, Question, QuestionBank
+from az104_search import fold
+
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy las firmas se calculan en Python puro (mismo resultado)
+    np = None
+
+SHINGLE_SIZE = 3
+# Firma de BANDS * ROWS valores; con 25 x 5 una pareja con similitud 0.7 coincide
+# en alguna banda el 99% de las veces y una con 0.3, el 6%. Con umbrales por
+# debajo de 0.5 empiezan a escaparse parejas.
+BANDS = 25
+ROWS = 5
+SIGNATURE_SIZE = BANDS * ROWS
+THRESHOLD = 0.7
+
+_WORD = re.compile(r'[a-z0-9]+')
+_HASH_BITS = 56
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_EMPTY = -1
+
+
+class _WordHashes(dict):
+    """Hash estable de cada palabra, calculado una sola vez"""
+
+    def __missing__(self, word: str) -> int:
+        value = self[word] = int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), 'little')
+        return value
+
+
+_word_hashes = _WordHashes()
+
+
+def shingles(question: Question) -> Set[int]:
+    """Hashes de los 3-gramas de palabras del enunciado y las opciones"""
+    text = fold(' '.join((question.question,) + question.options))
+    words = list(map(_word_hashes.__getitem__, _WORD.findall(text)))
+    if len(words) < SHINGLE_SIZE:
+        return {hash(tuple(words)) & _HASH_MASK} if words else set()
+    # hash() de una tupla de enteros no depende de PYTHONHASHSEED
+    return {h & _HASH_MASK for h in map(hash, zip(*(words[i:] for i in range(SHINGLE_SIZE))))}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+# ----------------------------------------------------------------------------
+# Firmas MinHash de una sola permutación: cada hash cae en una de
+# SIGNATURE_SIZE casillas según su resto y la casilla guarda el menor cociente.
+# Las casillas vacías toman el valor de la siguiente ocupada, desplazado según
+# la distancia, para que dos firmas solo coincidan ahí si coinciden sus vecinas.
+
+def _signature_python(hashes: Iterable[int]) -> List[int]:
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    for h in hashes:
+        slot, value = h % SIGNATURE_SIZE, h // SIGNATURE_SIZE
+        if bins[slot] == _EMPTY or value < bins[slot]:
+            bins[slot] = value
+    filled = list(bins)
+    for slot in range(SIGNATURE_SIZE):
+        if bins[slot] != _EMPTY:
+            continue
+        for distance in range(1, SIGNATURE_SIZE):
+            value = bins[(slot + distance) % SIGNATURE_SIZE]
+            if value != _EMPTY:
+                filled[slot] = value + (distance << _HASH_BITS)
+                break
+    return filled
+
+
+def _signatures_python(sets: Sequence[Set[int]]) -> List[List[int]]:
+    return [_signature_python(hashes) for hashes in sets]
+
+
+def _signatures_numpy(sets: Sequence[Set[int]]):
+    """Las mismas firmas que _signatures_python, para todo el banco a la vez"""
+    sizes = np.fromiter((len(hashes) for hashes in sets), dtype=np.int64, count=len(sets))
+    hashes = np.fromiter(chain.from_iterable(sets), dtype=np.int64, count=int(sizes.sum()))
+    docs = np.repeat(np.arange(len(sets), dtype=np.int64), sizes)
+    cells = docs * SIGNATURE_SIZE + hashes % SIGNATURE_SIZE
+    values = hashes // SIGNATURE_SIZE
+    # Menor valor de cada casilla
+    unset = np.iinfo(np.int64).max
+    bins = np.full(len(sets) * SIGNATURE_SIZE, unset, dtype=np.int64)
+    np.minimum.at(bins, cells, values)
+    bins[bins == unset] = _EMPTY
+    bins = bins.reshape(len(sets), SIGNATURE_SIZE)
+
+    filled = bins.copy()
+    for distance in range(1, SIGNATURE_SIZE):
+        missing = filled == _EMPTY
+        if not missing.any():
+            break
+        shifted = np.roll(bins, -distance, axis=1)
+        take = missing & (shifted != _EMPTY)
+        filled[take] = shifted[take] + (distance << _HASH_BITS)
+    return filled
+
+
+def _buckets_python(signatures) -> Iterator[List[int]]:
+    for band in range(BANDS):
+        start = band * ROWS
+        buckets = {}
+        for i, signature in enumerate(signatures):
+            buckets.setdefault(tuple(signature[start:start + ROWS]), []).append(i)
+        for members in buckets.values():
+            if len(members) > 1:
+                yield members
+
+
+def _buckets_numpy(signatures) -> Iterator[List[int]]:
+    """Los mismos cubos que _buckets_python, en el mismo orden"""
+    for band in range(BANDS):
+        rows = np.ascontiguousarray(signatures[:, band * ROWS:(band + 1) * ROWS])
+        _, bucket, counts = np.unique(rows.view(np.dtype((np.void, rows.dtype.itemsize * ROWS))).ravel(),
+                                      return_inverse=True, return_counts=True)
+        bucket = bucket.ravel()
+        docs = np.flatnonzero(counts[bucket] > 1)
+        order = np.argsort(bucket[docs], kind='stable')
+        docs, keys = docs[order].tolist(), bucket[docs][order].tolist()
+        found = []
+        start = 0
+        for end in range(1, len(docs) + 1):
+            if end == len(docs) or keys[end] != keys[start]:
+                found.append(docs[start:end])
+                start = end
+        # Como en Python: por orden de aparición del primer miembro
+        found.sort(key=lambda members: members[0])
+        yield from found
+
+
+class DuplicateGroup:
+    """Preguntas casi iguales entre sí, con las parejas que las unieron y su similitud"""
+    __slots__ = ('questions', 'pairs')
+
+    def __init__(self, questions: List[Question], pairs: List[Tuple[str, str, float]]):
+        self.questions = questions
+        self.pairs = pairs
+
+    @property
+    def similarity(self) -> float:
+        return max(similarity for _, _, similarity in self.pairs)
+
+    def to_dict(self) -> Dict:
+        return {
+            'keys': [q.key for q in self.questions],
+            'pairs': [{'a': a, 'b': b, 'similarity': round(similarity, 4)} for a, b, similarity in self.pairs],
+        }
+
+
+def find_duplicates(questions: Sequence[Question], threshold: float = THRESHOLD) -> List[DuplicateGroup]:
+    """Grupos de preguntas cuya similitud (Jaccard de 3-gramas) es al menos ``threshold``"""
+    # Las preguntas sin texto no se pueden comparar
+    sets, kept = [], []
+    for question in questions:
+        hashes = shingles(question)
+        if hashes:
+            sets.append(hashes)
+            kept.append(question)
+    questions = kept
+    if np is not None and questions:
+        buckets = _buckets_numpy(_signatures_numpy(sets))
+    else:
+        buckets = _buckets_python(_signatures_python(sets))
+
+    # Las parejas de cada cubo se confirman con la similitud exacta y se unen
+    # en grupos. Dentro de un cubo basta con enlazar cada pregunta una vez con
+    # cada grupo, así que un grupo grande de copias no cuesta parejas al cuadrado.
+    parent = list(range(len(questions)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    edges = []
+    checked = set()
+    for members in buckets:
+        seen = {}  # raíz -> miembros del cubo ya vistos en ese grupo
+        for i in members:
+            root = find(i)
+            joined = seen.pop(root, [])
+            for other_root in list(seen):
+                for other in seen[other_root]:
+                    if (other, i) in checked:
+                        continue
+                    checked.add((other, i))
+                    # La similitud nunca supera el cociente de los tamaños
+                    small, large = sorted((len(sets[other]), len(sets[i])))
+                    if small < threshold * large:
+                        continue
+                    similarity = jaccard(sets[other], sets[i])
+                    if similarity >= threshold:
+                        edges.append((other, i, similarity))
+                        parent[other_root] = root
+                        joined.extend(seen.pop(other_root))
+                        break
+            joined.append(i)
+            seen[root] = joined
+
+    members, pairs = {}, {}
+    for a, b, similarity in edges:
+        pairs.setdefault(find(a), []).append((questions[a].key, questions[b].key, similarity))
+    for i in range(len(questions)):
+        if find(i) in pairs:
+            members.setdefault(find(i), []).append(questions[i])
+    groups = [DuplicateGroup(members[root], pairs[root]) for root in pairs]
+    groups.sort(key=lambda group: (-group.similarity, group.questions[0].index))
+    return groups
+
+
+def print_report(groups: List[DuplicateGroup], total: int, threshold: float, elapsed: float) -> None:
+    engine = 'NumPy' if np is not None else 'Python'
+    print(f"{total} preguntas revisadas en {elapsed:.2f} s ({engine}); similitud mínima {threshold:.2f}\n")
+    if not groups:
+        print("No se encontraron preguntas casi duplicadas.")
+        return
+    for n, group in enumerate(groups, 1):
+        print(f"Grupo {n} — similitud máxima {group.similarity:.2f}")
+        for question in group.questions:
+            text = ' '.join(question.question.split())
+            print(f"  [{question.key}] {text[:70]}{'…' if len(text) > 70 else ''}")
+        for a, b, similarity in group.pairs:
+            print(f"    {a} ~ {b}: {similarity:.2f}")
+        print()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Busca preguntas casi duplicadas en el banco AZ-104")
+    parser.add_argument('--bank', default=BANK_FILE, help="banco de preguntas (por defecto, az104_questions.jsonl)")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="similitud mínima (0-1) para considerar dos preguntas duplicadas")
+    parser.add_argument('--json', action='store_true', help="escribe los grupos en JSON")
+    args = parser.parse_args(argv)
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold debe estar entre 0 y 1")
+
+    bank = QuestionBank.from_file(args.bank)
+    started = time.perf_counter()
+    groups = find_duplicates(bank.questions, args.threshold)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        json.dump({'questions': len(bank), 'threshold': args.threshold,
+                   'groups': [group.to_dict() for group in groups]},
+                  sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        print_report(groups, len(bank), args.threshold, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Repaso espaciado
+Planificador estilo SM-2: cada pregunta respondida guarda su próxima fecha de
+repaso y su factor de facilidad en SQLite, y una cola de prioridad entrega las
+pendientes por orden de fecha.
+"""
+
+import heapq
+import random
+import sqlite3
+from datetime import date
+from typing import Container, Dict, Iterable, List, Optional
+
+from az104_bank import user_data_path
+
+REVIEW_DB = 'reviews.sqlite3'
+
+# Parámetros de SM-2
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+# Calidad de la respuesta (0-5 en SM-2): el simulador solo sabe si fue correcta
+QUALITY_CORRECT = 4
+QUALITY_WRONG = 1
+
+
+def today() -> int:
+    """Día actual como ordinal (las fechas de repaso se guardan en días)"""
+    return date.today().toordinal()
+
+
+class ReviewCard:
+    """Estado de repaso de una pregunta"""
+    __slots__ = ('key', 'due', 'interval', 'ease', 'reps', 'lapses', 'seq')
+
+    def __init__(self, key: str, due: int = 0, interval: int = 0, ease: float = DEFAULT_EASE,
+                 reps: int = 0, lapses: int = 0):
+        self.key = key
+        self.due = due
+        self.interval = interval
+        self.ease = ease
+        self.reps = reps
+        self.lapses = lapses
+        # Entrada vigente en la cola de prioridad (las anteriores se descartan al salir)
+        self.seq = 0
+
+    def schedule(self, quality: int, day: int) -> None:
+        """Calcula el siguiente repaso según SM-2"""
+        if quality < 3:
+            self.reps = 0
+            self.interval = 1
+            self.lapses += 1
+        else:
+            self.reps += 1
+            if self.reps == 1:
+                self.interval = 1
+            elif self.reps == 2:
+                self.interval = 6
+            else:
+                self.interval = round(self.interval * self.ease)
+        penalty = 5 - quality
+        self.ease = max(MIN_EASE, self.ease + 0.1 - penalty * (0.08 + penalty * 0.02))
+        self.due = day + self.interval
+
+    def __repr__(self):
+        # due=0 marca una tarjeta que nunca se programó (no es una fecha válida)
+        due = date.fromordinal(self.due) if self.due > 0 else '-'
+        return f"<ReviewCard {self.key} due={due} ease={self.ease:.2f}>"
+
+
+class ReviewStore:
+    """Tarjetas de repaso en un archivo SQLite (una fila por pregunta)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or user_data_path(REVIEW_DB)
+        self.conn = sqlite3.connect(self.path)
+        with self.conn:
+            self.conn.execute('CREATE TABLE IF NOT EXISTS reviews '
+                              '(key TEXT PRIMARY KEY, due INTEGER NOT NULL, interval INTEGER NOT NULL, '
+                              'ease REAL NOT NULL, reps INTEGER NOT NULL, lapses INTEGER NOT NULL)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS reviews_due ON reviews (due)')
+
+    def load(self) -> List[ReviewCard]:
+        rows = self.conn.execute('SELECT key, due, interval, ease, reps, lapses FROM reviews')
+        return [ReviewCard(*row) for row in rows]
+
+    def save(self, card: ReviewCard) -> None:
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?)',
+                              (card.key, card.due, card.interval, card.ease, card.reps, card.lapses))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class ReviewScheduler:
+    """Cola de repasos ordenada por fecha.
+
+    La cola es un montículo de ``(fecha, secuencia, clave)``: sacar la siguiente
+    pregunta pendiente cuesta O(log n). Al reprogramar una tarjeta se añade una
+    entrada nueva y la anterior queda obsoleta (su secuencia ya no coincide).
+    """
+
+    def __init__(self, store: ReviewStore):
+        self.store = store
+        self.cards: Dict[str, ReviewCard] = {}
+        self._heap = []
+        self._seq = 0
+        for card in store.load():
+            self.cards[card.key] = card
+            self._heap.append(self._entry(card))
+        heapq.heapify(self._heap)
+
+    def _entry(self, card: ReviewCard):
+        self._seq += 1
+        card.seq = self._seq
+        return (card.due, card.seq, card.key)
+
+    def _pop_valid(self):
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            card = self.cards.get(entry[2])
+            if card is not None and card.seq == entry[1]:
+                return entry
+        return None
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def due(self, day: Optional[int] = None, limit: Optional[int] = None,
+            valid: Optional[Container[str]] = None) -> List[str]:
+        """Claves pendientes hasta ``day`` (hoy por defecto), las más atrasadas primero.
+
+        Con ``valid``, las tarjetas de claves que ya no están ahí (preguntas
+        retiradas del banco) se descartan en lugar de ocupar sitio en el repaso.
+        """
+        day = today() if day is None else day
+        taken = []
+        while limit is None or len(taken) < limit:
+            entry = self._pop_valid()
+            if entry is None:
+                break
+            if valid is not None and entry[2] not in valid:
+                del self.cards[entry[2]]
+                continue
+            taken.append(entry)
+            if entry[0] > day:
+                break
+        # Siguen en la cola hasta que se respondan
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return [key for due, _, key in taken if due <= day]
+
+    def new(self, keys: Iterable[str], limit: int, rng: Optional[random.Random] = None) -> List[str]:
+        """Hasta ``limit`` claves al azar de entre las que aún no tienen tarjeta"""
+        unseen = [key for key in keys if key not in self.cards]
+        return (rng or random).sample(unseen, min(limit, len(unseen)))
+
+    def record(self, key: str, correct: bool, day: Optional[int] = None) -> ReviewCard:
+        """Reprograma una pregunta después de responderla"""
+        card = self.cards.get(key)
+        if card is None:
+            card = self.cards[key] = ReviewCard(key)
+        card.schedule(QUALITY_CORRECT if correct else QUALITY_WRONG, today() if day is None else day)
+        self.store.save(card)
+        heapq.heappush(self._heap, self._entry(card))
+        return card
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+AZ-104 - Búsqueda de preguntas
+Índice invertido sobre el enunciado, las opciones y la explicación de cada
+pregunta, con búsqueda ordenada por BM25. El texto se normaliza sin tildes ni
+mayúsculas ("configuración" encuentra "configuracion") y los símbolos de las
+tablas markdown se descartan al separar palabras.
+"""
+
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from typing import Dict, List, Tuple
+
+from az104_bank import Question, QuestionBank
+
+# Parámetros de BM25
+K1 = 1.2
+B = 0.75
+
+# Peso de cada campo al contar apariciones (el enunciado cuenta más)
+FIELD_WEIGHTS = (('question', 2), ('options', 1), ('explanation', 1))
+
+# Palabras demasiado frecuentes para aportar nada a la búsqueda
+STOPWORDS = frozenset("""
+    a al como con de del el en es esta este la las lo los o para por que se su sus un una y
+    the of to and in is for on with
+""".split())
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+# Marcas diacríticas combinables (tildes, diéresis...) tras descomponer con NFKD
+_COMBINING_MARKS = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]+')
+
+
+def fold(text: str) -> str:
+    """Minúsculas y sin tildes, para comparar texto en español"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    return _COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text))
+
+
+def tokenize(text: str) -> List[str]:
+    """Palabras normalizadas de un texto (sin tildes, sin signos ni palabras vacías)"""
+    return [token for token in _TOKEN.findall(fold(text)) if token not in STOPWORDS]
+
+
+def _fields(question: Question) -> Dict[str, str]:
+    return {
+        'question': question.question,
+        'options': '\n'.join(question.options),
+        'explanation': question.explanation,
+    }
+
+
+class SearchIndex:
+    """Índice invertido de las preguntas, sincronizable con un QuestionBank.
+
+    ``postings`` guarda, por término, la frecuencia ponderada en cada
+    pregunta. Al cambiar el banco solo se reindexan las preguntas nuevas o
+    modificadas (``sync``).
+    """
+
+    def __init__(self, bank: QuestionBank = None):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.lengths: Dict[str, int] = {}
+        self.terms: Dict[str, Tuple[str, ...]] = {}
+        self.total_length = 0
+        self.questions: Dict[str, Question] = {}
+        self.version = None
+        # Normalización de longitud de BM25 por pregunta; se recalcula tras cambios
+        self._norms: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        if bank is not None:
+            self.sync(bank)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def add(self, question: Question) -> None:
+        """Indexa una pregunta (reemplazando la versión anterior si la había)"""
+        if question.key in self.lengths:
+            self.remove(question.key)
+        counts = {}
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(_fields(question)[field]):
+                counts[token] = counts.get(token, 0) + weight
+        for token, count in counts.items():
+            self.postings.setdefault(token, {})[question.key] = count
+        length = sum(counts.values())
+        self.lengths[question.key] = length
+        self.terms[question.key] = tuple(counts)
+        self.total_length += length
+        self.questions[question.key] = question
+        self._norms = {}
+
+    def remove(self, key: str) -> None:
+        if self.questions.pop(key, None) is None:
+            return
+        self.total_length -= self.lengths.pop(key)
+        self._norms = {}
+        for token in self.terms.pop(key):
+            docs = self.postings[token]
+            del docs[key]
+            if not docs:
+                del self.postings[token]
+
+    def sync(self, bank: QuestionBank) -> None:
+        """Pone el índice al día con el banco, reindexando solo lo que cambió"""
+        if self.version == bank.version:
+            return
+        with self._lock:
+            if self.version == bank.version:
+                return
+            for key in [key for key in self.questions if key not in bank.by_key]:
+                self.remove(key)
+            for question in bank.questions:
+                indexed = self.questions.get(question.key)
+                if indexed is None or _fields(indexed) != _fields(question):
+                    self.add(question)
+                else:
+                    # Mismo texto: basta con apuntar al registro nuevo
+                    self.questions[question.key] = question
+            self.version = bank.version
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[Question, float]]:
+        """Las ``limit`` preguntas más relevantes para la consulta, con su puntuación"""
+        if not self.lengths:
+            return []
+        count = len(self.lengths)
+        norms = self._norms
+        if not norms:
+            average = self.total_length / count
+            norms = self._norms = {key: K1 * (1 - B + B * length / average)
+                                   for key, length in self.lengths.items()}
+        scores = {}
+        for token in set(tokenize(query)):
+            docs = self.postings.get(token)
+            if not docs:
+                continue
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            weight = idf * (K1 + 1)
+            for key, tf in docs.items():
+                scores[key] = scores.get(key, 0.0) + weight * tf / (tf + norms[key])
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(self.questions[key], score) for key, score in best]
+
+
+def snippet(question: Question, query: str, width: int = 90) -> str:
+    """Fragmento del texto de la pregunta alrededor del primer término buscado"""
+    terms = tokenize(query)
+    for field in ('question', 'options', 'explanation'):
+        text = ' '.join(_fields(question)[field].split())
+        folded = fold(text)
+        if len(folded) != len(text):
+            # Algún carácter se descompuso en varios: las posiciones ya no coinciden
+            folded = text.lower()
+        for term in terms:
+            match = re.search(r'\b' + re.escape(term), folded)
+            if match:
+                start = max(0, min(match.start() - width // 3, len(text) - width))
+                fragment = text[start:start + width]
+                return ('…' if start else '') + fragment + ('…' if start + width < len(text) else '')
+    text = ' '.join(question.question.split())
+    return text[:width] + ('…' if len(text) > width else '')
+
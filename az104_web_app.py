@@ -7,1272 +7,66 @@ Aplicación Web Interactiva
 import http.server
 import socketserver
 import json
+import gzip
+import zlib
+import hashlib
+import functools
+import time
+import random
+import re
+import secrets
+import shutil
+import sqlite3
+import tempfile
 import webbrowser
 import threading
 import os
+import signal
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
 from urllib.parse import parse_qs, urlparse
 
+from az104_attempts import AttemptLog
+from az104_bank import BANK, grade, indices_mask, user_data_path
+from az104_search import SearchIndex, snippet
+
 PORT = 8080
 
-
-# Banco de preguntas estilo examen real AZ-104
-# Basado en Microsoft Learn Study Guide (Abril 2025)
-
-QUESTIONS_DB = {
-    "governance": {
-        "name": "Administrar Identidades y Gobernanza de Azure",
-        "percentage": "20-25%",
-        "icon": "👥",
-        "color": "#4A90D9",
-        "questions": [
-            {
-                "id": 1,
-                "type": "single",
-                "question": """CASO DE ESTUDIO: Contoso, Ltd.
-
-Contoso, Ltd. es una empresa de consultoría con oficinas principales en Montreal y sucursales en Seattle y Nueva York.
-
-La empresa tiene los siguientes usuarios en Microsoft Entra ID:
-
-| Usuario | Departamento | Rol actual |
-|---------|--------------|------------|
-| User1 | IT | Global Reader |
-| User2 | HR | None |
-| User3 | Finance | User Administrator |
-
-User2 necesita crear y administrar grupos de seguridad en Microsoft Entra ID, pero NO debe poder crear ni administrar usuarios.
-
-¿Cuál es el rol de Microsoft Entra ID con PRIVILEGIOS MÍNIMOS que debe asignar a User2?""",
-                "options": ['Global Administrator', 'User Administrator', 'Groups Administrator', 'Directory Writers'],
-                "answer": 2,
-                "explanation": "Groups Administrator es el rol con privilegios mínimos que permite crear y administrar todos los aspectos de los grupos sin tener permisos para administrar usuarios. User Administrator puede crear grupos pero también tiene permisos para administrar usuarios, lo cual viola el principio de privilegio mínimo. Global Administrator tiene todos los permisos. Directory Writers no puede crear grupos de seguridad."
-            },
-            {
-                "id": 2,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una suscripción de Azure llamada Sub1 que contiene los siguientes recursos:
-
-| Nombre | Tipo | Grupo de Recursos |
-|--------|------|-------------------|
-| VM1 | Virtual Machine | RG-Prod |
-| VM2 | Virtual Machine | RG-Prod |
-| SA1 | Storage Account | RG-Data |
-| VNET1 | Virtual Network | RG-Network |
-
-Un administrador llamado Admin1 necesita poder asignar roles de Azure RBAC a otros usuarios para los recursos en Sub1.
-
-Admin1 NO debe poder:
-- Crear ni eliminar recursos
-- Modificar configuraciones de recursos
-
-¿Qué rol debe asignar a Admin1?""",
-                "options": ['Owner', 'Contributor', 'User Access Administrator', 'Security Administrator'],
-                "answer": 2,
-                "explanation": "User Access Administrator permite gestionar el acceso de usuarios a los recursos de Azure (asignar roles RBAC) sin poder crear, modificar o eliminar recursos. Owner tiene todos los permisos incluyendo RBAC y administración de recursos. Contributor puede administrar recursos pero NO puede asignar roles. Security Administrator es para configuraciones de seguridad en Microsoft Defender for Cloud."
-            },
-            {
-                "id": 3,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene la siguiente configuración de Azure:
-
-- Tenant de Microsoft Entra: fabrikam.com
-- Suscripción: Fabrikam-Prod
-- Política de la empresa: Los recursos solo pueden crearse en East US y West US
-
-Los desarrolladores reportan que pudieron crear máquinas virtuales en North Europe, violando la política de la empresa.
-
-Necesita implementar una solución que PREVENGA la creación de recursos en regiones no autorizadas.
-
-¿Qué efecto de Azure Policy debe usar?""",
-                "options": ['Audit', 'Deny', 'Append', 'DeployIfNotExists'],
-                "answer": 1,
-                "explanation": "El efecto 'Deny' previene activamente la creación o actualización de recursos que no cumplan con la política. 'Audit' solo registra el incumplimiento en el Activity Log pero permite la creación. 'Append' agrega propiedades a recursos. 'DeployIfNotExists' despliega recursos de remediación después de la creación del recurso no conforme."
-            },
-            {
-                "id": 4,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum tiene la siguiente jerarquía de Azure:
-
-Tenant Root Group
-└── MG-Enterprise
-    ├── MG-Production
-    │   ├── Sub-Prod1
-    │   └── Sub-Prod2
-    └── MG-Development
-        └── Sub-Dev1
-
-Aplica una Azure Policy en MG-Production que requiere la etiqueta "CostCenter" en todos los recursos.
-
-¿Qué recursos serán evaluados por esta política?""",
-                "options": ['Solo los recursos en Sub-Prod1', 'Los recursos en Sub-Prod1 y Sub-Prod2', 'Los recursos en todas las suscripciones (Sub-Prod1, Sub-Prod2, Sub-Dev1)', 'Solo los recursos creados después de asignar la política'],
-                "answer": 1,
-                "explanation": "Las políticas de Azure se heredan hacia abajo en la jerarquía. Una política asignada a MG-Production afectará a todas las suscripciones dentro de ese grupo de administración (Sub-Prod1 y Sub-Prod2), pero NO a Sub-Dev1 que está en MG-Development. La política evalúa tanto recursos existentes como nuevos."
-            },
-            {
-                "id": 5,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Un usuario de Contoso con el rol Contributor en la suscripción intenta crear una máquina virtual y recibe el siguiente error:
-
-"RequestDisallowedByPolicy: Resource 'VM3' was disallowed by policy."
-
-La suscripción tiene la siguiente configuración:
-- Azure Policy: "Allowed virtual machine size SKUs" configurada para permitir solo Standard_D2s_v3
-- Resource Locks: Ninguno configurado
-
-El usuario intentó crear una VM con el tamaño Standard_B2ms.
-
-¿Cuál es la causa del error?""",
-                "options": ['El rol Contributor no tiene permisos para crear VMs', 'Azure Policy está bloqueando la creación porque el SKU no está permitido', 'Existe un Resource Lock de tipo ReadOnly en la suscripción', 'El usuario necesita el rol Owner para crear VMs'],
-                "answer": 1,
-                "explanation": "El mensaje 'RequestDisallowedByPolicy' indica que una Azure Policy está bloqueando la operación. La política 'Allowed virtual machine size SKUs' solo permite Standard_D2s_v3, pero se intentó crear con Standard_B2ms. El rol Contributor tiene permisos completos para crear VMs. Azure Policy se evalúa DESPUÉS de RBAC y puede bloquear operaciones incluso con permisos suficientes."
-            },
-            {
-                "id": 6,
-                "type": "multiple",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank necesita configurar Microsoft Entra ID para cumplir con los siguientes requisitos:
-
-- Los usuarios deben poder restablecer sus propias contraseñas sin contactar al helpdesk
-- Se requiere autenticación multifactor para usuarios con roles administrativos
-- Los dispositivos móviles de los empleados deben poder acceder a recursos corporativos
-
-¿Qué DOS características de Microsoft Entra debe configurar? (Seleccione dos)""",
-                "options": ['Self-Service Password Reset (SSPR)', 'Microsoft Entra Connect', 'Conditional Access', 'Microsoft Entra Domain Services'],
-                "answer": [0, 2],
-                "explanation": "Self-Service Password Reset (SSPR) permite a los usuarios restablecer sus propias contraseñas. Conditional Access permite crear políticas que requieran MFA para roles específicos y controlar el acceso desde dispositivos. Microsoft Entra Connect es para sincronización con AD on-premises. Microsoft Entra Domain Services proporciona servicios de dominio administrados."
-            },
-            {
-                "id": 7,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders tiene una aplicación web en Azure App Service que necesita acceder a secretos almacenados en Azure Key Vault.
-
-Los requisitos son:
-- NO almacenar credenciales en el código o configuración de la aplicación
-- NO requerir rotación manual de credenciales
-- La identidad debe eliminarse automáticamente si se elimina la aplicación
-
-¿Qué debe configurar?""",
-                "options": ['Crear un Service Principal con secreto de cliente', 'Habilitar System-Assigned Managed Identity', 'Habilitar User-Assigned Managed Identity', 'Usar las Access Keys del Key Vault'],
-                "answer": 1,
-                "explanation": "System-Assigned Managed Identity cumple todos los requisitos: Azure gestiona las credenciales automáticamente, no requiere almacenar secretos, las credenciales rotan automáticamente, y la identidad se elimina cuando se elimina el recurso. User-Assigned Managed Identity persiste independientemente del recurso. Service Principal requiere gestión manual de secretos."
-            },
-            {
-                "id": 8,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene los siguientes grupos de recursos:
-
-| Grupo de Recursos | Bloqueo | Tipo de Bloqueo |
-|-------------------|---------|-----------------|
-| RG-Production | Lock1 | Delete |
-| RG-Staging | Ninguno | N/A |
-| RG-Development | Lock2 | ReadOnly |
-
-Un administrador con rol Owner intenta eliminar una VM en RG-Development.
-
-¿Cuál será el resultado?""",
-                "options": ['La VM se eliminará correctamente', 'La operación fallará porque el bloqueo ReadOnly previene eliminaciones', 'La operación fallará porque se requiere el rol Contributor', 'La VM se eliminará pero el disco persistirá'],
-                "answer": 1,
-                "explanation": "Un bloqueo ReadOnly previene cualquier modificación a los recursos, incluyendo eliminaciones. Incluso un Owner no puede eliminar recursos bajo un bloqueo ReadOnly sin primero eliminar el bloqueo. El bloqueo Delete solo previene eliminaciones pero permite modificaciones."
-            },
-            {
-                "id": 9,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware necesita implementar la siguiente política de etiquetado:
-
-"Todos los recursos DEBEN tener una etiqueta llamada 'Environment' con un valor. Los recursos sin esta etiqueta NO deben poder crearse."
-
-¿Qué definición de Azure Policy integrada debe usar?""",
-                "options": ['Require a tag and its value on resources', 'Require a tag on resource groups', 'Inherit a tag from the resource group if missing', 'Add a tag to resources'],
-                "answer": 0,
-                "explanation": "'Require a tag and its value on resources' usa el efecto Deny para prevenir la creación de recursos que no tengan la etiqueta especificada con un valor. 'Require a tag on resource groups' aplica solo a grupos de recursos. 'Inherit a tag' copia etiquetas pero no previene la creación. 'Add a tag' usa Modify para agregar etiquetas después de la creación."
-            },
-            {
-                "id": 10,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene usuarios externos que necesitan colaborar en proyectos de Azure. Los usuarios externos son de una organización asociada con el dominio partner.com.
-
-Los requisitos son:
-- Los usuarios externos deben autenticarse usando sus credenciales de partner.com
-- Los usuarios externos deben poder acceder a recursos específicos en la suscripción de Fabrikam
-- Debe minimizarse la sobrecarga administrativa
-
-¿Qué debe configurar?""",
-                "options": ['Crear usuarios miembro en Microsoft Entra ID para cada usuario externo', 'Configurar Microsoft Entra B2B collaboration e invitar usuarios guest', 'Configurar Microsoft Entra B2C', 'Crear un nuevo tenant de Microsoft Entra para los usuarios externos'],
-                "answer": 1,
-                "explanation": "Microsoft Entra B2B (Business-to-Business) collaboration permite invitar usuarios externos como guests. Los usuarios se autentican con sus propias credenciales (partner.com) y pueden acceder a recursos según los permisos asignados. B2C es para aplicaciones consumer-facing. Crear usuarios miembro o un nuevo tenant aumentaría la sobrecarga administrativa."
-            },
-            {
-                "id": 11,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene configurado Microsoft Entra Connect para sincronizar su Active Directory on-premises con Microsoft Entra ID.
-
-Un usuario on-premises llamado User1 tiene los siguientes atributos:
-- userPrincipalName: user1@contoso.local
-- mail: user1@contoso.com
-
-Después de la sincronización, User1 no puede iniciar sesión en Azure Portal.
-
-¿Qué debe hacer para resolver el problema?""",
-                "options": ['Cambiar el userPrincipalName on-premises a user1@contoso.com', 'Agregar y verificar el dominio contoso.local en Microsoft Entra ID', 'Deshabilitar la sincronización de hash de contraseñas', 'Asignar una licencia de Microsoft Entra ID Premium a User1'],
-                "answer": 0,
-                "explanation": "El dominio .local no es un dominio enrutable en Internet y no puede verificarse en Microsoft Entra ID. El userPrincipalName debe usar un dominio verificado (como contoso.com) para que el usuario pueda autenticarse. La solución es cambiar el UPN on-premises a un dominio verificado o agregar un sufijo UPN alternativo en Active Directory."
-            },
-            {
-                "id": 12,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum necesita delegar la administración de Azure de la siguiente manera:
-
-- El equipo de Network debe poder administrar solo redes virtuales y NSGs
-- El equipo de Database debe poder administrar solo servidores SQL y bases de datos
-- Ningún equipo debe poder administrar recursos fuera de su área
-
-¿Cuál es la mejor estrategia para implementar esto?""",
-                "options": ['Asignar el rol Owner a cada equipo en la suscripción con Azure Policy para restringir', 'Crear grupos de recursos separados y asignar roles específicos a cada equipo en su grupo de recursos', 'Asignar el rol Contributor a todos los usuarios en la suscripción', 'Crear suscripciones separadas para cada equipo'],
-                "answer": 1,
-                "explanation": "La mejor práctica es usar grupos de recursos para agrupar recursos relacionados y asignar roles RBAC específicos (como Network Contributor, SQL DB Contributor) a cada equipo en su grupo de recursos correspondiente. Esto implementa el principio de mínimo privilegio y segmentación. Crear suscripciones separadas sería excesivo para este escenario."
-            },
-            {
-                "id": 13,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank tiene los siguientes requisitos de cumplimiento:
-
-- Los usuarios con roles administrativos deben solicitar activación de sus privilegios
-- La activación debe requerir aprobación de un manager
-- Se debe registrar quién aprobó cada activación
-- Los privilegios deben expirar automáticamente después de 8 horas
-
-¿Qué característica de Microsoft Entra debe implementar?""",
-                "options": ['Conditional Access', 'Privileged Identity Management (PIM)', 'Identity Protection', 'Access Reviews'],
-                "answer": 1,
-                "explanation": "Privileged Identity Management (PIM) proporciona activación just-in-time de roles privilegiados, flujos de aprobación, registro de auditoría completo y duración configurable de la activación. Conditional Access controla el acceso basado en condiciones pero no gestiona activación de roles. Access Reviews es para revisiones periódicas de acceso. Identity Protection detecta riesgos de identidad."
-            },
-            {
-                "id": 14,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita optimizar los costos de Azure. El equipo de finanzas requiere:
-
-- Recibir alertas cuando el gasto supere el 80% del presupuesto mensual
-- Ver recomendaciones para reducir costos
-- Analizar el gasto por departamento usando etiquetas
-
-¿Qué herramientas debe usar?""",
-                "options": ['Azure Monitor y Log Analytics', 'Azure Cost Management + Billing y Azure Advisor', 'Azure Policy y Resource Graph', 'Microsoft Defender for Cloud'],
-                "answer": 1,
-                "explanation": "Azure Cost Management + Billing proporciona análisis de costos, presupuestos con alertas, y puede agrupar costos por etiquetas. Azure Advisor proporciona recomendaciones de optimización de costos (como VMs infrautilizadas, reservas). Azure Monitor es para métricas y logs operacionales. Azure Policy es para gobernanza, no análisis de costos."
-            },
-            {
-                "id": 15,
-                "type": "multiple",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso está configurando Microsoft Entra Connect para sincronizar usuarios desde Active Directory on-premises.
-
-Los requisitos son:
-- Los usuarios deben poder usar las mismas credenciales on-premises y en la nube
-- La autenticación debe validarse contra el AD on-premises
-- Si la conexión a on-premises falla, los usuarios deben poder seguir autenticándose
-
-¿Qué DOS opciones de autenticación debe configurar? (Seleccione dos)""",
-                "options": ['Password Hash Synchronization (PHS)', 'Pass-through Authentication (PTA)', 'Federation with AD FS', 'Certificate-based authentication'],
-                "answer": [0, 1],
-                "explanation": "Pass-through Authentication (PTA) valida contraseñas contra AD on-premises en tiempo real. Password Hash Synchronization (PHS) debe habilitarse como respaldo - si PTA falla, los usuarios pueden autenticarse usando los hashes sincronizados. Federation con AD FS también validaría on-premises pero no se solicitó y PTA es más simple. Certificate-based auth no es un método de Microsoft Entra Connect."
-            }
-        ]
-    },
-    "storage": {
-        "name": "Implementar y Administrar Almacenamiento",
-        "percentage": "15-20%",
-        "icon": "💾",
-        "color": "#50C878",
-        "questions": [
-            {
-                "id": 1,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene una cuenta de almacenamiento llamada contosostorage con la siguiente configuración:
-
-| Propiedad | Valor |
-|-----------|-------|
-| Rendimiento | Standard |
-| Redundancia | LRS |
-| Nivel de acceso | Hot |
-
-Contoso almacena archivos de log que:
-- Se acceden frecuentemente durante los primeros 30 días
-- Raramente se acceden después de 30 días
-- Deben retenerse por 1 año
-- Deben optimizarse para costo
-
-¿Qué debe configurar?""",
-                "options": ['Cambiar la redundancia a GRS', 'Configurar Lifecycle Management para mover blobs a Cool después de 30 días y a Archive después de 90 días', 'Cambiar el nivel de acceso de la cuenta a Cool', 'Habilitar soft delete con retención de 365 días'],
-                "answer": 1,
-                "explanation": "Lifecycle Management permite automatizar el movimiento de blobs entre tiers basado en la antigüedad. Hot tier para los primeros 30 días (acceso frecuente), Cool tier para 30-90 días (acceso infrecuente, menor costo de almacenamiento), y Archive para el resto del año (costo mínimo de almacenamiento). Esto optimiza los costos automáticamente."
-            },
-            {
-                "id": 2,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene requisitos de recuperación de desastres para sus datos en Azure Storage:
-
-- Los datos deben estar disponibles si toda la región primaria falla
-- La aplicación debe poder leer datos de la región secundaria inmediatamente durante una interrupción
-- Los costos deben minimizarse
-
-¿Qué tipo de redundancia debe configurar?""",
-                "options": ['Locally Redundant Storage (LRS)', 'Zone-Redundant Storage (ZRS)', 'Geo-Redundant Storage (GRS)', 'Read-Access Geo-Redundant Storage (RA-GRS)'],
-                "answer": 3,
-                "explanation": "RA-GRS replica datos a una región secundaria (como GRS) Y permite acceso de lectura a la región secundaria sin necesidad de failover. GRS también replica geográficamente pero la región secundaria solo es accesible después de un failover iniciado por Microsoft o el cliente. LRS y ZRS no proporcionan redundancia geográfica."
-            },
-            {
-                "id": 3,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene múltiples máquinas virtuales Windows que necesitan compartir archivos. Los requisitos son:
-
-- Los archivos deben ser accesibles via protocolo SMB
-- Múltiples VMs deben poder acceder simultáneamente
-- Se requiere capacidad de 500 GB
-- Los archivos deben poder montarse como una unidad de red (Z:)
-
-¿Qué servicio de Azure Storage debe usar?""",
-                "options": ['Azure Blob Storage', 'Azure Files', 'Azure Queue Storage', 'Azure Table Storage'],
-                "answer": 1,
-                "explanation": "Azure Files proporciona file shares completamente administrados accesibles via protocolo SMB 3.0. Puede montarse como una unidad de red en Windows (y Linux/macOS) y permite acceso simultáneo desde múltiples VMs. Blob Storage es para objetos/archivos no estructurados pero no soporta SMB. Queue es para mensajería, Table para datos NoSQL."
-            },
-            {
-                "id": 4,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank necesita proporcionar acceso temporal a un contractor externo para descargar un archivo específico de Blob Storage.
-
-Los requisitos son:
-- El acceso debe expirar en 24 horas
-- El contractor solo debe poder descargar, no modificar ni eliminar
-- NO debe compartirse las access keys de la cuenta de almacenamiento
-- El acceso debe ser solo para ese archivo específico
-
-¿Qué debe crear?""",
-                "options": ['Una Stored Access Policy', 'Un Service SAS token con permisos de lectura', 'Un User Delegation SAS token', 'Configurar acceso anónimo público en el contenedor'],
-                "answer": 1,
-                "explanation": "Un Service SAS (Shared Access Signature) permite delegar acceso granular a un recurso específico (blob individual) con permisos específicos (solo lectura) y tiempo de expiración (24 horas). User Delegation SAS usaría credenciales de Microsoft Entra pero tiene los mismos beneficios. Stored Access Policy define políticas reusables pero necesita SAS para generar tokens. Acceso anónimo expondría el archivo a todos."
-            },
-            {
-                "id": 5,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum tiene datos en Azure Blob Storage que deben cumplir con regulaciones de retención legal:
-
-- Los datos NO deben poder modificarse durante 7 años
-- Los datos NO deben poder eliminarse durante 7 años
-- Debe cumplir con SEC Rule 17a-4
-
-¿Qué debe configurar?""",
-                "options": ['Soft delete con retención de 7 años', 'Blob versioning', 'Immutable storage con time-based retention policy', 'Legal hold sin retention policy'],
-                "answer": 2,
-                "explanation": "Immutable storage con time-based retention policy proporciona almacenamiento WORM (Write Once, Read Many) que cumple con regulaciones como SEC 17a-4, FINRA, CFTC. Los blobs no pueden modificarse ni eliminarse durante el período de retención. Soft delete permite recuperación pero no previene eliminación. Legal hold no tiene período definido. Versioning mantiene versiones pero permite eliminación."
-            },
-            {
-                "id": 6,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita migrar 60 TB de datos desde un datacenter on-premises a Azure Blob Storage.
-
-Las restricciones son:
-- La conexión de red es de solo 100 Mbps
-- La migración debe completarse en menos de 2 semanas
-- Los datos contienen información sensible
-
-¿Cuál es la mejor solución?""",
-                "options": ['Usar AzCopy para transferir los datos por Internet', 'Usar Azure Data Box', 'Configurar Azure File Sync', 'Usar Azure Storage Explorer'],
-                "answer": 1,
-                "explanation": "Con 100 Mbps, transferir 60 TB tomaría aproximadamente 55 días (60TB × 8 / 0.1Gbps / 86400). Azure Data Box es un dispositivo físico que Microsoft envía, se cargan los datos localmente (encriptados), y se envía de vuelta a Microsoft para cargar a Azure. Puede transferir hasta 80 TB por dispositivo en días. Es la única opción viable para cumplir el deadline de 2 semanas."
-            },
-            {
-                "id": 7,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene una cuenta de almacenamiento con un blob en el tier Archive. Se necesita acceso urgente al blob para una auditoría.
-
-¿Qué debe hacer y cuál es el tiempo estimado?""",
-                "options": ['Acceder directamente al blob; disponible inmediatamente', 'Cambiar el tier a Hot; disponible en minutos', 'Rehidratar el blob con prioridad Standard; disponible en hasta 15 horas', 'Rehidratar el blob con prioridad High; disponible en menos de 1 hora para blobs < 10 GB'],
-                "answer": 3,
-                "explanation": "Los blobs en Archive tier no pueden accederse directamente; deben rehidratarse a Hot o Cool tier primero. Con prioridad High (disponible para blobs < 10 GB), la rehidratación puede completarse en menos de 1 hora. Con prioridad Standard, puede tomar hasta 15 horas. El costo de rehidratación con High priority es mayor."
-            },
-            {
-                "id": 8,
-                "type": "multiple",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware necesita configurar seguridad para una cuenta de almacenamiento que contiene datos sensibles.
-
-Los requisitos son:
-- Solo VMs en la VNet corporativa pueden acceder a la cuenta de almacenamiento
-- Los datos deben estar encriptados con claves controladas por Litware
-- El acceso desde Internet público debe estar bloqueado
-
-¿Qué DOS configuraciones debe implementar? (Seleccione dos)""",
-                "options": ['Configurar Storage Firewall y agregar la VNet', 'Habilitar Customer-Managed Keys (CMK) con Azure Key Vault', 'Configurar acceso anónimo a nivel de cuenta', 'Cambiar la redundancia a GRS'],
-                "answer": [0, 1],
-                "explanation": "Storage Firewall permite restringir el acceso a VNets específicas y bloquear acceso público. Customer-Managed Keys (CMK) permite usar sus propias claves de Azure Key Vault para el cifrado, dando control total sobre las claves. El acceso anónimo haría lo contrario de lo requerido. GRS es para redundancia, no seguridad."
-            },
-            {
-                "id": 9,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene un servidor de archivos Windows on-premises con 2 TB de datos. Necesitan:
-
-- Mantener los archivos accesibles localmente para acceso rápido
-- Sincronizar los archivos con Azure Files
-- Liberar espacio en el servidor local moviendo archivos poco usados a la nube
-- Los usuarios deben ver todos los archivos aunque estén en la nube
-
-¿Qué debe implementar?""",
-                "options": ['Azure Backup', 'Azure File Sync con Cloud Tiering habilitado', 'AzCopy con sincronización programada', 'Robocopy a Azure Blob Storage'],
-                "answer": 1,
-                "explanation": "Azure File Sync sincroniza servidores Windows con Azure Files. Cloud Tiering es una característica opcional que convierte archivos poco accedidos en stubs (punteros) que se descargan on-demand, liberando espacio local mientras los usuarios ven todos los archivos. Azure Backup es para respaldos, no sincronización. AzCopy y Robocopy no proporcionan tiering."
-            },
-            {
-                "id": 10,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank eliminó accidentalmente un blob importante hace 3 días. La cuenta de almacenamiento tiene soft delete habilitado con retención de 14 días.
-
-¿Cómo puede recuperar el blob?""",
-                "options": ['Restaurar desde Azure Backup', 'Usar la operación Undelete desde el portal de Azure o código', 'Contactar a Microsoft Support para recuperar el blob', 'El blob no puede recuperarse después de 24 horas'],
-                "answer": 1,
-                "explanation": "Con soft delete habilitado, los blobs eliminados se mantienen en estado 'soft deleted' durante el período de retención configurado (14 días en este caso). Pueden recuperarse usando la operación Undelete desde Azure Portal, PowerShell, Azure CLI, o código. No se necesita backup separado ni contactar a soporte."
-            },
-            {
-                "id": 11,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum necesita configurar una cuenta de almacenamiento para Azure Data Lake Storage Gen2 para análisis de big data.
-
-¿Qué debe habilitar durante la creación de la cuenta de almacenamiento?""",
-                "options": ['Large file shares', 'Hierarchical namespace', 'NFS 3.0 protocol', 'SFTP'],
-                "answer": 1,
-                "explanation": "Hierarchical namespace es el requisito para habilitar Azure Data Lake Storage Gen2. Proporciona un sistema de archivos jerárquico real (directorios, permisos a nivel de archivo) sobre Blob Storage, necesario para operaciones eficientes de big data como rename atómico de directorios. Las otras opciones son características separadas que no habilitan ADLS Gen2."
-            },
-            {
-                "id": 12,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene dos cuentas de almacenamiento en regiones diferentes:
-
-| Cuenta | Región | Propósito |
-|--------|--------|-----------|
-| contosoprod | East US | Producción |
-| contosodr | West US | DR |
-
-Necesita copiar blobs de contosoprod a contosodr de forma asíncrona, sin descargar los datos al cliente.
-
-¿Qué método debe usar?""",
-                "options": ['AzCopy sync desde una VM', 'Copy Blob API (Start-AzStorageBlobCopy)', 'Azure Storage Explorer drag and drop', 'Object Replication'],
-                "answer": 3,
-                "explanation": "Object Replication copia blobs asincrónicamente entre cuentas de almacenamiento sin intervención del cliente. Los datos se copian directamente entre cuentas en el backend de Azure. Copy Blob API también es asíncrono y server-side, pero Object Replication es para replicación continua automática. AzCopy y Storage Explorer requieren un cliente intermediario."
-            },
-            {
-                "id": 13,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders tiene una aplicación que necesita almacenar millones de mensajes pequeños para procesamiento asíncrono.
-
-Los requisitos son:
-- Procesamiento FIFO garantizado
-- Detección de mensajes duplicados
-- Soporte para transacciones
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Queue Storage', 'Azure Service Bus Queue', 'Azure Event Hub', 'Azure Event Grid'],
-                "answer": 1,
-                "explanation": "Azure Service Bus Queue proporciona FIFO garantizado (con sesiones), detección de duplicados, y soporte para transacciones. Azure Queue Storage es más simple y económico pero NO garantiza FIFO estricto ni tiene detección de duplicados. Event Hub es para streaming de eventos de alto volumen. Event Grid es para eventos reactivos, no colas de mensajes."
-            },
-            {
-                "id": 14,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una cuenta de almacenamiento con el firewall habilitado, permitiendo solo la VNet VNet-Prod.
-
-Una aplicación en otra VNet (VNet-Dev) necesita acceder a la cuenta de almacenamiento sin deshabilitar el firewall.
-
-¿Qué puede configurar? (Seleccione la opción más apropiada)""",
-                "options": ['Agregar VNet-Dev al firewall de la cuenta de almacenamiento', 'Crear un Private Endpoint en VNet-Dev', 'Configurar VNet Peering entre VNet-Prod y VNet-Dev', 'A o B son opciones válidas'],
-                "answer": 3,
-                "explanation": "Ambas opciones son válidas: 1) Agregar VNet-Dev al firewall usando Service Endpoints permite tráfico desde esa VNet. 2) Private Endpoint crea una interfaz de red privada en VNet-Dev con IP privada para la cuenta de almacenamiento. VNet Peering solo no es suficiente; también necesitaría Service Endpoint o Private Endpoint."
-            },
-            {
-                "id": 15,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam necesita configurar acceso a Azure Files para aplicaciones que usan identidades de Microsoft Entra.
-
-Los requisitos son:
-- Las aplicaciones deben autenticarse usando Microsoft Entra ID
-- Los permisos deben configurarse a nivel de share y archivo/directorio
-- NO usar access keys
-
-¿Qué debe configurar?""",
-                "options": ['Shared Access Signatures (SAS)', 'Identity-based authentication con Microsoft Entra ID', 'Storage account access keys', 'Anonymous public access'],
-                "answer": 1,
-                "explanation": "Azure Files soporta identity-based authentication con Microsoft Entra ID (anteriormente Azure AD DS o Microsoft Entra Domain Services, y ahora también Microsoft Entra Kerberos para usuarios híbridos). Permite asignar permisos RBAC a nivel de share y permisos NTFS a nivel de archivo/directorio. SAS usa tokens, no identidades. Access keys dan acceso completo."
-            }
-        ]
-    },
-    "compute": {
-        "name": "Desplegar y Administrar Recursos de Cómputo de Azure",
-        "percentage": "20-25%",
-        "icon": "🖥️",
-        "color": "#FF6B6B",
-        "questions": [
-            {
-                "id": 1,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso está desplegando una aplicación crítica que requiere un SLA de 99.99% de disponibilidad.
-
-La aplicación se ejecutará en máquinas virtuales en Azure.
-
-¿Qué configuración cumple con el requisito de SLA?""",
-                "options": ['Una VM con Premium SSD', 'Dos VMs en un Availability Set', 'Dos o más VMs en diferentes Availability Zones', 'Una VM con un disco Ultra'],
-                "answer": 2,
-                "explanation": "Para lograr 99.99% de SLA, se requieren dos o más VMs desplegadas en diferentes Availability Zones. Una sola VM tiene máximo 99.9% de SLA (con Premium SSD). Availability Sets proporcionan 99.95% de SLA. Availability Zones son ubicaciones físicamente separadas dentro de una región con energía, red y refrigeración independientes."
-            },
-            {
-                "id": 2,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una VM llamada VM1 con el tamaño Standard_D4s_v3. Necesitan cambiar el tamaño a Standard_D8s_v3.
-
-VM1 está actualmente en ejecución.
-
-¿Qué sucederá cuando cambie el tamaño?""",
-                "options": ['La VM se redimensionará sin interrupción', 'La VM se reiniciará durante el proceso', 'La VM se eliminará y se creará una nueva', 'El cambio fallará; debe detener la VM primero'],
-                "answer": 1,
-                "explanation": "Cuando se redimensiona una VM en ejecución, Azure la reiniciará para aplicar el nuevo tamaño. Si el nuevo tamaño no está disponible en el cluster actual, la VM debe ser desasignada (deallocated) primero. En este caso, Standard_D8s_v3 está en la misma familia que D4s_v3, así que probablemente solo reiniciará."
-            },
-            {
-                "id": 3,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam necesita ejecutar un script de configuración automáticamente cada vez que se despliega una nueva VM desde una imagen.
-
-El script debe:
-- Instalar software adicional
-- Configurar el sistema operativo
-- Ejecutarse sin intervención manual
-
-¿Qué debe usar?""",
-                "options": ['Run Command', 'Custom Script Extension', 'Boot diagnostics', 'Serial Console'],
-                "answer": 1,
-                "explanation": "Custom Script Extension permite ejecutar scripts automáticamente durante o después del despliegue de VMs. Los scripts pueden descargarse desde Azure Storage, GitHub, o cualquier URL. Se integra con plantillas ARM/Bicep para automatización completa. Run Command es para ejecución ad-hoc. Boot diagnostics es para diagnóstico. Serial Console es para acceso de consola."
-            },
-            {
-                "id": 4,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum tiene una VM que no puede arrancar después de una actualización del sistema operativo.
-
-El equipo de IT no puede conectarse via RDP porque la VM no completa el arranque.
-
-¿Qué herramienta debe usar para diagnosticar y solucionar el problema?""",
-                "options": ['Azure Bastion', 'Network Watcher', 'Serial Console', 'Run Command'],
-                "answer": 2,
-                "explanation": "Serial Console proporciona acceso de consola de texto a una VM, útil cuando RDP/SSH no funcionan debido a problemas de arranque, configuración de red o sistema operativo corrupto. Permite interactuar con el bootloader y el sistema operativo en modo texto. Bastion requiere que la VM responda. Run Command requiere que el agente de VM funcione."
-            },
-            {
-                "id": 5,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita ejecutar contenedores Docker para procesar trabajos batch de corta duración.
-
-Los requisitos son:
-- No gestionar infraestructura de servidores
-- Pagar solo por el tiempo de ejecución
-- Iniciar contenedores rápidamente bajo demanda
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Kubernetes Service (AKS)', 'Azure Container Instances (ACI)', 'Azure App Service for Containers', 'Virtual Machines con Docker'],
-                "answer": 1,
-                "explanation": "Azure Container Instances (ACI) es un servicio serverless para ejecutar contenedores sin gestionar VMs ni orquestadores. Factura por segundo de ejecución, inicia en segundos, e ideal para cargas batch, tareas programadas o procesamiento de eventos. AKS requiere gestión del cluster. App Service tiene instancias siempre activas. VMs requieren gestión de infraestructura."
-            },
-            {
-                "id": 6,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank tiene un App Service Plan en el tier Standard S1. La aplicación web experimenta picos de tráfico predecibles cada lunes de 9am a 12pm.
-
-Necesita configurar auto-scaling para manejar los picos de forma económica.
-
-¿Qué tipo de scaling debe configurar?""",
-                "options": ['Scale up manual a un tier más alto', 'Scale out basado en métrica de CPU', 'Scale out programado para lunes 9am-12pm', 'Scale out basado en métricas Y programado'],
-                "answer": 2,
-                "explanation": "Para picos de tráfico predecibles con horario conocido, scale out programado es la mejor opción. Configura reglas que aumentan las instancias automáticamente en el horario especificado (lunes 9am) y las reducen después (12pm). El scaling basado en métricas es mejor para tráfico impredecible. Combinar ambos es válido pero más complejo para este escenario simple."
-            },
-            {
-                "id": 7,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso necesita desplegar una aplicación web .NET 6 en Azure App Service.
-
-La aplicación requiere:
-- Auto-scaling basado en demanda
-- Slots de deployment para staging
-- Backups diarios automatizados
-
-¿Cuál es el tier MÍNIMO de App Service Plan requerido?""",
-                "options": ['Free (F1)', 'Basic (B1)', 'Standard (S1)', 'Premium (P1v2)'],
-                "answer": 2,
-                "explanation": "Standard (S1) es el tier mínimo que soporta auto-scaling, deployment slots (hasta 5), y backups diarios (hasta 10 por día). Basic soporta hasta 3 instancias pero manual scaling, sin slots ni backups automatizados. Free es muy limitado. Premium agrega más slots, más backups, y otras características enterprise."
-            },
-            {
-                "id": 8,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una VM con un disco OS de 128 GB que necesita expandirse a 256 GB.
-
-¿Cuáles son los pasos correctos?""",
-                "options": ['Expandir el disco desde el portal mientras la VM está en ejecución', 'Detener (deallocate) la VM, expandir el disco, iniciar la VM, extender la partición en el OS', 'Crear un snapshot, crear un nuevo disco de 256 GB desde el snapshot', 'Agregar un nuevo disco de datos de 128 GB'],
-                "answer": 1,
-                "explanation": "Para expandir un disco OS managed: 1) Deallocate la VM (no solo detener), 2) Expandir el disco en el portal/CLI/PowerShell, 3) Iniciar la VM, 4) Dentro del sistema operativo, extender la partición/volumen para usar el espacio adicional. Los discos de datos pueden expandirse sin deallocate en muchos casos, pero discos OS requieren deallocate."
-            },
-            {
-                "id": 9,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam quiere crear una imagen personalizada de una VM para usarla como plantilla para múltiples VMs.
-
-La imagen debe incluir el sistema operativo Windows Server 2022 con aplicaciones preinstaladas.
-
-¿Cuál es el proceso correcto?""",
-                "options": ['Crear un snapshot del disco OS y usarlo como imagen', 'Ejecutar Sysprep en la VM, deallocate, marcar como generalizada, capturar imagen', 'Copiar el disco VHD a otra cuenta de almacenamiento', 'Exportar la VM a un archivo OVF'],
-                "answer": 1,
-                "explanation": "Para crear una imagen generalizada reutilizable: 1) Ejecutar Sysprep /generalize /oobe /shutdown en Windows (o waagent -deprovision en Linux), 2) Deallocate la VM, 3) Marcarla como generalizada (Set-AzVm -Generalized), 4) Capturar como imagen (New-AzImage o desde portal). Las imágenes generalizadas permiten crear VMs con identidades únicas."
-            },
-            {
-                "id": 10,
-                "type": "multiple",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum está configurando un Virtual Machine Scale Set (VMSS) para una aplicación web.
-
-Necesitan:
-- Aumentar instancias automáticamente cuando CPU > 75%
-- Reducir instancias cuando CPU < 25%
-- Mínimo 2 instancias, máximo 10 instancias
-
-¿Qué DOS configuraciones son REQUERIDAS para auto-scaling? (Seleccione dos)""",
-                "options": ['Regla de scale out (aumentar instancias)', 'Regla de scale in (reducir instancias)', 'Load Balancer', 'Application Gateway'],
-                "answer": [0, 1],
-                "explanation": "Para auto-scaling efectivo basado en métricas se requieren: 1) Regla de scale out para aumentar capacidad bajo carga alta, 2) Regla de scale in para reducir capacidad y costos cuando la demanda baja. Load Balancer es recomendado para distribuir tráfico pero no es técnicamente requerido para que auto-scaling funcione."
-            },
-            {
-                "id": 11,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders tiene una aplicación en App Service que necesita acceder a secretos en Azure Key Vault.
-
-Actualmente, la aplicación usa un connection string almacenado en App Settings.
-
-¿Cuál es la forma más segura de acceder a Key Vault?""",
-                "options": ['Almacenar el secreto de Key Vault en App Settings', 'Usar Key Vault references en App Settings', 'Habilitar System-Assigned Managed Identity y dar acceso a Key Vault', 'B y C combinados'],
-                "answer": 3,
-                "explanation": "La solución más segura combina: 1) Managed Identity para autenticación sin secretos, 2) Key Vault references (@Microsoft.KeyVault(SecretUri=...)) en App Settings que resuelven automáticamente los secretos. Esto elimina secretos del código y configuración, y usa la identidad administrada para autenticarse con Key Vault."
-            },
-            {
-                "id": 12,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank tiene un App Service con dos deployment slots: Production y Staging.
-
-Han desplegado una nueva versión en Staging y necesitan moverla a Production sin tiempo de inactividad.
-
-¿Qué operación debe realizar?""",
-                "options": ['Copiar los archivos de Staging a Production', 'Realizar un Swap de slots', 'Eliminar Production y renombrar Staging a Production', 'Redirigir manualmente el tráfico'],
-                "answer": 1,
-                "explanation": "Swap de slots intercambia las configuraciones y contenido entre slots instantáneamente. Azure realiza un 'warm up' del slot de destino antes del swap para evitar cold starts. Si hay problemas, puede hacer swap de nuevo para revertir. Es la forma estándar de implementar deployments blue-green sin downtime en App Service."
-            },
-            {
-                "id": 13,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso necesita desplegar un cluster de Kubernetes administrado.
-
-Los requisitos son:
-- Azure debe gestionar el control plane
-- Contoso debe gestionar los worker nodes
-- Integración con Microsoft Entra ID para autenticación
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Container Instances', 'Azure Kubernetes Service (AKS)', 'Azure Container Apps', 'Azure Red Hat OpenShift'],
-                "answer": 1,
-                "explanation": "Azure Kubernetes Service (AKS) es el servicio de Kubernetes administrado donde Azure gestiona el control plane (API server, etcd, scheduler) sin costo adicional, y el usuario gestiona los worker nodes (node pools). Soporta integración nativa con Microsoft Entra ID. ACI es serverless sin Kubernetes. Container Apps abstrae más la infraestructura."
-            },
-            {
-                "id": 14,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una VM con alta latencia de disco. Actualmente usa Standard HDD.
-
-La VM ejecuta una base de datos que requiere:
-- Alto IOPS (> 50,000)
-- Baja latencia (< 1ms)
-- Throughput consistente
-
-¿Qué tipo de disco debe usar?""",
-                "options": ['Standard SSD', 'Premium SSD', 'Premium SSD v2', 'Ultra Disk'],
-                "answer": 3,
-                "explanation": "Ultra Disk proporciona el mejor rendimiento con IOPS (hasta 160,000), throughput (hasta 4,000 MB/s), y latencia sub-millisegundo. Permite configurar IOPS y throughput independientemente. Premium SSD v2 también ofrece alto rendimiento pero Ultra Disk es superior para requisitos extremos como bases de datos de alto rendimiento. Premium SSD tiene límites más bajos."
-            },
-            {
-                "id": 15,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene VMs que solo se usan durante horario laboral (8am-6pm, lunes a viernes).
-
-Necesitan reducir costos de estas VMs.
-
-¿Qué solución debe implementar?""",
-                "options": ['Comprar Azure Reserved Instances', 'Configurar auto-shutdown en las VMs', 'Usar Azure Automation para start/stop programado', 'Cambiar a VMs más pequeñas'],
-                "answer": 2,
-                "explanation": "Azure Automation con runbooks permite programar el inicio Y detención de VMs. Auto-shutdown solo detiene las VMs pero no las inicia automáticamente. Las VMs detenidas (deallocated) no incurren costos de cómputo. Reserved Instances son para VMs que corren 24/7. Cambiar el tamaño no reduce costos si no se necesitan las VMs."
-            }
-        ]
-    },
-    "networking": {
-        "name": "Implementar y Administrar Redes Virtuales",
-        "percentage": "15-20%",
-        "icon": "🌐",
-        "color": "#9B59B6",
-        "questions": [
-            {
-                "id": 1,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene dos VNets en la misma región:
-
-| VNet | Espacio de direcciones | Recursos |
-|------|------------------------|----------|
-| VNet-Hub | 10.0.0.0/16 | Firewall, VPN Gateway |
-| VNet-Spoke | 10.1.0.0/16 | VMs de aplicación |
-
-Las VMs en VNet-Spoke necesitan comunicarse con recursos en VNet-Hub.
-
-El tráfico NO debe pasar por Internet.
-
-¿Qué debe configurar?""",
-                "options": ['VPN Gateway', 'VNet Peering', 'ExpressRoute', 'NAT Gateway'],
-                "answer": 1,
-                "explanation": "VNet Peering conecta dos VNets directamente a través del backbone de Microsoft Azure. El tráfico es privado, de baja latencia, y nunca pasa por Internet. Es la solución más simple y económica para conectar VNets en la misma región o diferentes regiones (Global VNet Peering). VPN Gateway es para conexiones cifradas sobre Internet."
-            },
-            {
-                "id": 2,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene una subnet con servidores web que deben ser accesibles SOLO por HTTPS (puerto 443) desde Internet.
-
-Todo otro tráfico entrante debe ser bloqueado.
-
-¿Qué debe configurar?""",
-                "options": ['Azure Firewall', 'Network Security Group (NSG)', 'Application Gateway con WAF', 'Azure Front Door'],
-                "answer": 1,
-                "explanation": "Network Security Group (NSG) es un firewall de capa 3/4 que filtra tráfico hacia y desde recursos de Azure. Puede asociarse a subnets o NICs. Para este requisito simple (permitir solo 443 entrante), un NSG es la solución más directa y económica. Azure Firewall es para escenarios más complejos. WAF es para protección de aplicaciones web."
-            },
-            {
-                "id": 3,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene VMs en una subnet privada (sin IP pública) que necesitan:
-
-- Acceder a Internet para descargar actualizaciones
-- NO ser accesibles desde Internet
-
-¿Qué debe configurar?""",
-                "options": ['Asignar IPs públicas a las VMs', 'Configurar NAT Gateway', 'Configurar VNet Peering con una VNet pública', 'Crear una VPN Point-to-Site'],
-                "answer": 1,
-                "explanation": "NAT Gateway permite que recursos en subnets privadas accedan a Internet para tráfico saliente sin exponer IPs públicas. Todo el tráfico saliente usa la IP del NAT Gateway. Las conexiones entrantes desde Internet no son posibles con NAT Gateway, cumpliendo el requisito de seguridad."
-            },
-            {
-                "id": 4,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum está desplegando una aplicación web que requiere:
-
-- Balanceo de carga en capa 7 (HTTP/HTTPS)
-- Terminación SSL/TLS
-- Enrutamiento basado en URL path (/api/* va a backend-api, /* va a backend-web)
-- Web Application Firewall (WAF)
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Load Balancer', 'Azure Application Gateway', 'Azure Traffic Manager', 'Azure Load Balancer Standard'],
-                "answer": 1,
-                "explanation": "Application Gateway es un load balancer de capa 7 (aplicación) que soporta terminación SSL, enrutamiento basado en URL/host/headers, y WAF integrado. Azure Load Balancer es capa 4 (TCP/UDP) sin estas características. Traffic Manager es DNS-based para enrutamiento global, no para balanceo de aplicaciones."
-            },
-            {
-                "id": 5,
-                "type": "multiple",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita establecer una conexión VPN Site-to-Site entre su datacenter on-premises y Azure.
-
-El datacenter tiene un dispositivo VPN con IP pública 203.0.113.10.
-El rango de red on-premises es 192.168.0.0/16.
-
-¿Qué DOS recursos debe crear en Azure? (Seleccione dos)""",
-                "options": ['Virtual Network Gateway (VPN Gateway)', 'Local Network Gateway', 'ExpressRoute Circuit', 'Azure Bastion'],
-                "answer": [0, 1],
-                "explanation": "Para Site-to-Site VPN se requieren: 1) Virtual Network Gateway (VPN Gateway) - el endpoint de VPN en Azure, 2) Local Network Gateway - representa el dispositivo VPN on-premises (IP pública 203.0.113.10) y los rangos de red on-premises (192.168.0.0/16). Luego se crea una Connection entre ambos. ExpressRoute es una tecnología diferente."
-            },
-            {
-                "id": 6,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank tiene una VM que actúa como Network Virtual Appliance (firewall).
-
-Todo el tráfico desde la subnet App-Subnet debe pasar por el NVA antes de ir a Internet.
-
-¿Qué debe configurar?""",
-                "options": ['NSG con regla de denegación', 'User Defined Route (UDR) con next hop al NVA', 'VNet Peering', 'Service Endpoint'],
-                "answer": 1,
-                "explanation": "User Defined Routes (UDR) permiten personalizar el enrutamiento de tráfico en Azure. Cree una Route Table con una ruta para 0.0.0.0/0 (todo el tráfico a Internet) con next hop type 'Virtual Appliance' y la IP del NVA. Asocie la Route Table a App-Subnet. El tráfico se redirigirá al NVA antes de salir a Internet."
-            },
-            {
-                "id": 7,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene una aplicación que necesita conectarse a Azure SQL Database de forma completamente privada.
-
-Los requisitos son:
-- El tráfico nunca debe salir de la red de Microsoft
-- La base de datos no debe tener endpoint público
-- Debe resolverse usando una IP privada
-
-¿Qué debe configurar?""",
-                "options": ['Service Endpoint para Microsoft.Sql', 'Private Endpoint', 'VNet Peering con la VNet de SQL', 'Firewall de Azure SQL para permitir la VNet'],
-                "answer": 1,
-                "explanation": "Private Endpoint crea una interfaz de red privada en su VNet para Azure SQL Database con una IP privada. El tráfico va completamente por la red privada de Microsoft. Puede deshabilitar el endpoint público. Service Endpoint también mantiene el tráfico en la red de Microsoft pero la base de datos mantiene su IP pública."
-            },
-            {
-                "id": 8,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene múltiples VNets y necesita resolución DNS privada entre todas ellas.
-
-Los requisitos son:
-- Registrar automáticamente los nombres de las VMs
-- Resolver nombres entre VNets
-- No usar servidores DNS personalizados
-
-¿Qué debe configurar?""",
-                "options": ['Azure DNS public zone', 'Azure Private DNS zone con VNet links', 'DNS servers en las VNets', 'Archivo hosts en cada VM'],
-                "answer": 1,
-                "explanation": "Azure Private DNS zones proporcionan resolución DNS dentro y entre VNets. Vincule la zona privada a las VNets que necesitan resolver nombres. Habilite auto-registration para que las VMs se registren automáticamente. Es una solución completamente administrada sin necesidad de servidores DNS. Las zonas públicas son para resolución desde Internet."
-            },
-            {
-                "id": 9,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam necesita conectar su datacenter on-premises a Azure con los siguientes requisitos:
-
-- Conexión privada dedicada (no Internet)
-- Latencia predecible y baja
-- Ancho de banda garantizado de 1 Gbps
-- SLA de conectividad
-
-¿Qué debe implementar?""",
-                "options": ['Site-to-Site VPN', 'Point-to-Site VPN', 'ExpressRoute', 'VNet Peering'],
-                "answer": 2,
-                "explanation": "ExpressRoute proporciona conexión privada dedicada entre on-premises y Azure a través de un proveedor de conectividad. Ofrece latencia predecible, ancho de banda garantizado (desde 50 Mbps hasta 100 Gbps), y SLA de disponibilidad. El tráfico no pasa por Internet público. VPN Site-to-Site usa Internet y no garantiza ancho de banda."
-            },
-            {
-                "id": 10,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum tiene un NSG con las siguientes reglas entrantes:
-
-| Prioridad | Nombre | Puerto | Acción |
-|-----------|--------|--------|--------|
-| 100 | Allow-HTTPS | 443 | Allow |
-| 200 | Deny-All | * | Deny |
-| 65000 | AllowVnetInBound | * | Allow |
-
-¿Qué tráfico entrante será permitido?""",
-                "options": ['Solo HTTPS (443) desde cualquier origen', 'HTTPS (443) y tráfico VNet-to-VNet', 'Todo el tráfico', 'Ningún tráfico'],
-                "answer": 0,
-                "explanation": "Las reglas NSG se evalúan por prioridad (menor número = mayor prioridad). HTTPS (443) es permitido por la regla 100. La regla 200 (Deny-All) bloquea todo otro tráfico ANTES de que se evalúe la regla default AllowVnetInBound (65000). Por lo tanto, incluso el tráfico VNet-to-VNet será bloqueado excepto 443."
-            },
-            {
-                "id": 11,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita balancear tráfico TCP entre múltiples VMs en una subnet privada.
-
-Los requisitos son:
-- Balanceador con IP privada
-- Alta disponibilidad
-- Health probes
-
-¿Qué tipo de recurso debe crear?""",
-                "options": ['Azure Load Balancer - Public', 'Azure Load Balancer - Internal', 'Application Gateway', 'Traffic Manager'],
-                "answer": 1,
-                "explanation": "Internal (Private) Load Balancer distribuye tráfico dentro de una VNet usando una IP privada. Es ideal para balancear tráfico entre tiers de aplicación (por ejemplo, tier web a tier de aplicación). Public Load Balancer usa IP pública. Application Gateway es capa 7 (HTTP). Traffic Manager es DNS-based para tráfico global."
-            },
-            {
-                "id": 12,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank tiene la siguiente configuración:
-
-- VNet1 tiene VMs
-- VNet2 tiene un VPN Gateway conectado a on-premises
-- VNet1 y VNet2 tienen VNet Peering configurado
-
-Las VMs en VNet1 necesitan acceder a recursos on-premises a través del gateway en VNet2.
-
-¿Qué configuración adicional necesita en el peering?""",
-                "options": ['Crear un VPN Gateway en VNet1', "Habilitar 'Allow Gateway Transit' en VNet2 y 'Use Remote Gateway' en VNet1", 'Crear otro peering bidireccional', 'No se necesita configuración adicional'],
-                "answer": 1,
-                "explanation": "Gateway Transit permite compartir un VPN/ExpressRoute gateway entre VNets peered. En VNet2 (que tiene el gateway), habilite 'Allow Gateway Transit'. En VNet1 (que quiere usar el gateway remoto), habilite 'Use Remote Gateway'. Esto evita desplegar gateways redundantes y reduce costos."
-            },
-            {
-                "id": 13,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso tiene usuarios remotos que trabajan desde casa y necesitan acceder a recursos en una VNet de Azure.
-
-Los requisitos son:
-- Conexión VPN desde laptops individuales
-- Autenticación con certificados o Microsoft Entra ID
-- No requiere dispositivo VPN dedicado
-
-¿Qué tipo de conexión debe configurar?""",
-                "options": ['Site-to-Site VPN', 'Point-to-Site VPN', 'ExpressRoute', 'Azure Bastion'],
-                "answer": 1,
-                "explanation": "Point-to-Site (P2S) VPN permite que clientes individuales (laptops, desktops) se conecten a una VNet de Azure desde cualquier ubicación. Soporta autenticación con certificados, RADIUS, o Microsoft Entra ID (nativo). Site-to-Site es para conexiones entre redes completas. Bastion es para acceso RDP/SSH a VMs específicas."
-            },
-            {
-                "id": 14,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware está diseñando la red para una aplicación de 3 tiers:
-
-- Web tier (frontend)
-- Application tier (lógica de negocio)
-- Database tier (SQL Server)
-
-¿Cuál es la mejor práctica para segmentación de red?""",
-                "options": ['Una subnet para todos los tiers', 'Una subnet por tier con NSGs entre ellos', 'Una VNet por tier con peering', 'VMs en diferentes regiones'],
-                "answer": 1,
-                "explanation": "La mejor práctica es usar subnets separadas para cada tier (Web, App, Database) dentro de la misma VNet, con NSGs para controlar el tráfico entre ellos. Por ejemplo: Web permite 443 desde Internet, App permite tráfico solo desde Web, Database permite SQL solo desde App. Una VNet por tier añadiría complejidad innecesaria."
-            },
-            {
-                "id": 15,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam necesita proteger sus aplicaciones web contra ataques como SQL injection, cross-site scripting (XSS), y otros del OWASP Top 10.
-
-¿Qué debe implementar?""",
-                "options": ['Network Security Group (NSG)', 'Azure Firewall', 'Web Application Firewall (WAF)', 'DDoS Protection Standard'],
-                "answer": 2,
-                "explanation": "Web Application Firewall (WAF) protege aplicaciones web contra vulnerabilidades comunes como SQL injection, XSS, y otras amenazas OWASP Top 10. Puede implementarse con Application Gateway o Azure Front Door. NSG es capa 3/4, no inspecciona contenido HTTP. Azure Firewall es capa 3-7 pero no específico para OWASP. DDoS es para ataques volumétricos."
-            }
-        ]
-    },
-    "monitoring": {
-        "name": "Monitorear y Mantener Recursos de Azure",
-        "percentage": "10-15%",
-        "icon": "📊",
-        "color": "#F39C12",
-        "questions": [
-            {
-                "id": 1,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso necesita ser notificado cuando el uso de CPU de una VM supere el 85% durante 5 minutos consecutivos.
-
-La notificación debe enviarse por email al equipo de operaciones.
-
-¿Qué debe configurar?""",
-                "options": ['Activity Log alert', 'Metric alert con Action Group', 'Log Analytics query', 'Azure Advisor alert'],
-                "answer": 1,
-                "explanation": "Metric alerts monitorean métricas de recursos (CPU, memoria, etc.) y pueden disparar cuando se cumplen condiciones específicas (CPU > 85% por 5 minutos). Action Groups definen las acciones a tomar (email, SMS, webhook, Azure Function, etc.). Activity Log alerts son para eventos de administración, no métricas de rendimiento."
-            },
-            {
-                "id": 2,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware necesita analizar logs de múltiples VMs para:
-
-- Buscar patrones de errores
-- Crear queries personalizadas
-- Visualizar tendencias
-- Configurar alertas basadas en logs
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Monitor Metrics', 'Log Analytics workspace', 'Storage Account logs', 'Azure Diagnostics extension'],
-                "answer": 1,
-                "explanation": "Log Analytics workspace (parte de Azure Monitor) almacena y permite consultar logs usando Kusto Query Language (KQL). Puede centralizar logs de múltiples recursos, crear dashboards, configurar alertas basadas en queries, y analizar patrones. Azure Monitor Metrics es para datos numéricos de series de tiempo. Storage Account almacena pero no permite queries avanzadas."
-            },
-            {
-                "id": 3,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam tiene VMs críticas que requieren:
-
-- Backups diarios automáticos
-- Retención de 30 días
-- Capacidad de restaurar archivos individuales sin restaurar toda la VM
-- Almacenamiento de backups en otra región
-
-¿Qué debe configurar?""",
-                "options": ['Azure Site Recovery', 'Azure Backup con Recovery Services vault (GRS)', 'Snapshots manuales del disco', 'AzCopy programado a otra región'],
-                "answer": 1,
-                "explanation": "Azure Backup con Recovery Services vault proporciona backups automáticos programados, políticas de retención configurables, y File Recovery para restaurar archivos individuales. Con redundancia GRS, los backups se replican a otra región. Site Recovery es para DR (replicación continua), no backups tradicionales. Snapshots son manuales y no incluyen File Recovery."
-            },
-            {
-                "id": 4,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-A. Datum quiere identificar oportunidades para:
-
-- Optimizar costos
-- Mejorar la seguridad
-- Aumentar la confiabilidad
-- Mejorar el rendimiento
-
-Todo desde un solo servicio con recomendaciones personalizadas.
-
-¿Qué herramienta debe usar?""",
-                "options": ['Azure Monitor', 'Azure Advisor', 'Microsoft Defender for Cloud', 'Azure Cost Management'],
-                "answer": 1,
-                "explanation": "Azure Advisor analiza la configuración y uso de recursos y proporciona recomendaciones personalizadas en cinco categorías: Reliability (confiabilidad), Security (seguridad), Performance (rendimiento), Cost (costo), y Operational Excellence. Es un servicio gratuito que consolida todas estas áreas. Defender for Cloud es específico para seguridad."
-            },
-            {
-                "id": 5,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita ver quién creó, modificó o eliminó recursos en una suscripción durante los últimos 90 días para una auditoría.
-
-¿Dónde debe buscar esta información?""",
-                "options": ['Azure Monitor Metrics', 'Activity Log', 'Resource health', 'Microsoft Defender for Cloud'],
-                "answer": 1,
-                "explanation": "Activity Log (registro de actividad) registra operaciones del plano de control realizadas en recursos: quién hizo qué operación, cuándo, desde dónde (IP), y el resultado. Incluye creación, modificación y eliminación de recursos. Se retiene 90 días por defecto. Para retención más larga, exportar a Log Analytics o Storage Account."
-            },
-            {
-                "id": 6,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Una aplicación web en App Service tiene errores HTTP 500 intermitentes. El equipo necesita:
-
-- Ver el stack trace de las excepciones
-- Correlacionar errores con requests específicos
-- Identificar dependencias lentas
-- Analizar el rendimiento de la aplicación
-
-¿Qué debe habilitar?""",
-                "options": ['Diagnostic settings', 'Application Insights', 'Log Analytics', 'Azure Monitor Metrics'],
-                "answer": 1,
-                "explanation": "Application Insights es una herramienta de Application Performance Management (APM) que proporciona telemetría completa de aplicaciones: requests, excepciones con stack traces, dependencias, métricas personalizadas, y correlación end-to-end. Se integra con App Service y proporciona dashboards de rendimiento y diagnóstico de errores."
-            },
-            {
-                "id": 7,
-                "type": "single",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso necesita implementar disaster recovery para VMs críticas con:
-
-- RPO (Recovery Point Objective) de 15 minutos
-- RTO (Recovery Time Objective) de 1 hora
-- Failover automático a región secundaria
-
-¿Qué servicio debe usar?""",
-                "options": ['Azure Backup', 'Azure Site Recovery', 'Availability Zones', 'Geo-redundant storage'],
-                "answer": 1,
-                "explanation": "Azure Site Recovery (ASR) proporciona replicación continua de VMs a una región secundaria con RPO de segundos a minutos. Permite failover rápido (minutos) cumpliendo RTO de 1 hora. Incluye planes de recuperación y pruebas de DR sin impacto. Azure Backup tiene RPO de horas (frecuencia de backup). Availability Zones son para HA regional, no DR."
-            },
-            {
-                "id": 8,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware tiene múltiples suscripciones y necesita:
-
-- Vista consolidada de costos de todas las suscripciones
-- Crear presupuestos mensuales con alertas
-- Analizar costos por departamento (usando tags)
-- Ver recomendaciones de ahorro
-
-¿Qué herramienta debe usar?""",
-                "options": ['Azure Pricing Calculator', 'Azure Cost Management + Billing', 'Azure Advisor (solo)', 'Azure Monitor'],
-                "answer": 1,
-                "explanation": "Azure Cost Management + Billing proporciona análisis de costos multi-suscripción, presupuestos con alertas configurables, agrupación por tags/resource groups/suscripciones, y recomendaciones de optimización de costos. Pricing Calculator es para estimar costos futuros, no analizar gastos actuales. Advisor proporciona algunas recomendaciones de costo pero no análisis completo."
-            },
-            {
-                "id": 9,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam necesita enviar logs de Windows Event Viewer de múltiples VMs a un Log Analytics workspace.
-
-¿Qué debe instalar en las VMs?""",
-                "options": ['Azure Diagnostics extension', 'Azure Monitor Agent', 'Application Insights SDK', 'Custom Script Extension'],
-                "answer": 1,
-                "explanation": "Azure Monitor Agent (AMA) es el agente recomendado para recopilar logs y métricas de VMs y enviarlos a Log Analytics workspace. Reemplaza al Legacy Log Analytics Agent (MMA) y Azure Diagnostics extension. Usa Data Collection Rules para configurar qué datos recopilar. Application Insights SDK es para aplicaciones, no logs del sistema operativo."
-            },
-            {
-                "id": 10,
-                "type": "single",
-                "question": """ESCENARIO: A. Datum Corporation
-
-Una VM de Azure muestra estado 'Unavailable' en Resource Health.
-
-¿Qué indica esto?""",
-                "options": ['La VM está apagada por el usuario', 'Azure detectó un problema de plataforma que afecta la VM', 'La VM necesita actualizaciones de sistema operativo', 'El disco de la VM está lleno'],
-                "answer": 1,
-                "explanation": "Resource Health muestra el estado actual e histórico de recursos. 'Unavailable' indica que Azure detectó un evento de plataforma (no causado por el usuario) que está afectando la disponibilidad del recurso. Proporciona información sobre la causa raíz y acciones recomendadas. VMs apagadas por usuario muestran 'Unknown' o estado diferente."
-            },
-            {
-                "id": 11,
-                "type": "single",
-                "question": """ESCENARIO: Tailwind Traders
-
-Tailwind Traders necesita ser notificado proactivamente cuando Azure planea realizar mantenimiento que afectará sus VMs.
-
-¿Qué debe configurar?""",
-                "options": ['Activity Log alert para eventos de VM', 'Service Health alerts', 'Metric alert para disponibilidad', 'Azure Advisor notifications'],
-                "answer": 1,
-                "explanation": "Service Health proporciona información personalizada sobre eventos de Azure que afectan sus recursos específicos: service issues (interrupciones), planned maintenance (mantenimiento planificado), y health advisories. Configure alertas de Service Health para recibir notificaciones proactivas sobre mantenimiento que afectará sus recursos."
-            },
-            {
-                "id": 12,
-                "type": "single",
-                "question": """ESCENARIO: Woodgrove Bank
-
-Woodgrove Bank necesita retener Activity Logs por 2 años para cumplimiento regulatorio.
-
-El Activity Log por defecto solo retiene 90 días.
-
-¿Qué debe configurar?""",
-                "options": ['Cambiar la configuración de retención del Activity Log', 'Exportar Activity Log a Log Analytics workspace o Storage Account', 'No es posible retener más de 90 días', 'Crear copias manuales cada 90 días'],
-                "answer": 1,
-                "explanation": "Activity Log tiene retención fija de 90 días que no puede cambiarse. Para retención más larga, configure Diagnostic Settings para exportar a: 1) Log Analytics workspace (hasta 12 años con archive), 2) Storage Account (retención ilimitada, más económico para largo plazo). También puede exportar a Event Hub para streaming a sistemas externos."
-            },
-            {
-                "id": 13,
-                "type": "multiple",
-                "question": """ESCENARIO: Contoso, Ltd.
-
-Contoso está configurando Azure Backup para proteger VMs.
-
-¿Cuáles DOS afirmaciones son correctas sobre Recovery Services vault? (Seleccione dos)""",
-                "options": ['El vault debe estar en la misma región que las VMs a proteger', 'Un vault puede proteger VMs en cualquier región', 'Se puede configurar soft delete para proteger contra eliminación accidental de backups', 'Los backups solo funcionan con VMs Windows'],
-                "answer": [0, 2],
-                "explanation": "Recovery Services vault debe estar en la misma región que las VMs que protege (o en la región emparejada para Cross-Region Restore). Soft delete mantiene los datos de backup por 14 días adicionales después de eliminar un backup, protegiendo contra eliminación accidental o ransomware. Azure Backup soporta tanto VMs Windows como Linux."
-            },
-            {
-                "id": 14,
-                "type": "single",
-                "question": """ESCENARIO: Litware, Inc.
-
-Litware necesita crear un dashboard que muestre:
-
-- Métricas de CPU y memoria de múltiples VMs
-- Logs de errores de aplicaciones
-- Estado de alertas activas
-- Visualizaciones interactivas
-
-¿Qué debe usar?""",
-                "options": ['Azure Portal Dashboard solamente', 'Azure Monitor Workbooks', 'Log Analytics queries solamente', 'Power BI'],
-                "answer": 1,
-                "explanation": "Azure Monitor Workbooks proporciona reportes interactivos que combinan métricas, logs, y visualizaciones en un solo canvas. Permite crear visualizaciones personalizadas, filtros interactivos, y combinar datos de múltiples fuentes. Los dashboards del portal son más limitados. Log Analytics queries son la base pero Workbooks agrega interactividad."
-            },
-            {
-                "id": 15,
-                "type": "single",
-                "question": """ESCENARIO: Fabrikam, Inc.
-
-Fabrikam configuró Site Recovery para VMs críticas. Necesita probar el plan de recuperación sin afectar la producción.
-
-¿Qué tipo de failover debe ejecutar?""",
-                "options": ['Planned failover', 'Unplanned failover', 'Test failover', 'Forced failover'],
-                "answer": 2,
-                "explanation": "Test failover crea una réplica de las VMs en la región secundaria en una red aislada, sin afectar la replicación ni las VMs de producción. Permite validar que el plan de recuperación funciona correctamente. Después de la prueba, se limpian los recursos de test. Planned/Unplanned failover son para eventos reales que afectan producción."
-            }
-        ]
-    }
-}
+# Concurrency modes for main(); see parse_args()
+SERVER_MODES = ('single', 'threads', 'prefork')
+DEFAULT_THREADS = 16
+# Prefork: a worker that dies sooner than this after starting counts as a crash;
+# respawns back off exponentially and the server gives up after too many in a row
+WORKER_MIN_UPTIME = 5.0
+WORKER_MAX_CRASHES = 5
+WORKER_RESPAWN_DELAY = 0.5
+
+# Bodies smaller than this are always sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+
+# /api/questions pagination and projection (see parse_question_query)
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+API_CACHE_CONTROL = 'public, max-age=300, must-revalidate'
+# Public fields only: answers and explanations are served by the session review
+QUESTION_FIELDS = ('topic', 'id', 'type', 'question', 'options')
+SEARCH_PAGE_SIZE = 10
+# How often requests check whether the question bank file changed (seconds)
+BANK_CHECK_INTERVAL = 2.0
+
+# Exam sessions: questions are sent SESSION_PREFETCH at a time
+SESSION_PREFETCH = 5
+SESSION_TTL = 4 * 60 * 60
+SESSION_LIMIT = 10000
+SESSION_PATH = re.compile(r'^/api/sessions/([A-Za-z0-9_-]+)/(questions|answers|review)$')
+MAX_REQUEST_BODY = 64 * 1024
+# Web answers get their own log (in DATA_DIR unless --attempts-db says otherwise),
+# so anonymous visitors don't end up in the local user's statistics
+WEB_ATTEMPTS_DB = 'web_attempts.sqlite3'
+MAX_ANSWER_BATCH = 100
+# Upper bound for a client-reported answer latency (the exam time limit)
+MAX_LATENCY_MS = 120 * 60 * 1000
 
 
 HTML_TEMPLATE = '''<!DOCTYPE html>
@@ -1637,6 +431,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         .topic-score.good { color: #50C878; }
         .topic-score.bad { color: #FF6B6B; }
 
+        .topic-time {
+            color: #888;
+            font-weight: normal;
+            margin-left: 10px;
+        }
+
         /* Navigation buttons */
         .nav-buttons {
             display: flex;
@@ -1677,8 +477,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
     </div>
 
     <script>
-        // Questions data from Python
-        const questionsDB = QUESTIONS_DATA_PLACEHOLDER;
+        // Topic catalog from Python; questions are fetched per session
+        const topicsCatalog = TOPICS_DATA_PLACEHOLDER;
+
+        // Questions are loaded in small windows ahead of the candidate
+        const PREFETCH_WINDOW = 5;
+        const PREFETCH_AHEAD = 2;
 
         // Timer - Cuenta regresiva de 120 minutos (7200 segundos)
         const EXAM_TIME_LIMIT = 120 * 60; // 120 minutos en segundos
@@ -1687,6 +491,8 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         // App state
         let state = {
             screen: 'menu',
+            sessionId: null,
+            submitting: false,
             currentQuestions: [],
             currentIndex: 0,
             score: 0,
@@ -1746,18 +552,50 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             }
         }
 
-        function finishExamDueToTimeout() {
+        async function finishExamDueToTimeout() {
+            // Cargar las preguntas pendientes y revelar sus respuestas para la revisión
+            const sessionId = state.sessionId;
+            const firstUnanswered = state.answers.length;
+            const pending = state.currentQuestions.length - firstUnanswered;
+            await loadQuestions(firstUnanswered, pending);
+            const graded = [];
+            for (let offset = firstUnanswered; offset < state.currentQuestions.length; offset += 100) {
+                const end = Math.min(offset + 100, state.currentQuestions.length);
+                const answers = [];
+                for (let position = offset; position < end; position++) {
+                    answers.push({ position, selected: null });
+                }
+                const batch = await api('POST', `/api/sessions/${sessionId}/answers`, { answers });
+                graded.push(...batch.results);
+            }
+            if (state.sessionId !== sessionId) return;
+
             // Marcar preguntas sin responder como incorrectas
-            while (state.answers.length < state.currentQuestions.length) {
+            graded.forEach(result => {
+                applyAnswerKey(state.currentQuestions[result.position], result);
                 state.answers.push({
                     selected: null,
-                    isCorrect: false
+                    isCorrect: result.correct,
+                    latency: null
                 });
-            }
+            });
             state.screen = 'results';
             render();
         }
 
+        function percentile(sorted, q) {
+            const position = (sorted.length - 1) * q / 100;
+            const low = Math.floor(position);
+            const high = Math.min(low + 1, sorted.length - 1);
+            return sorted[low] + (sorted[high] - sorted[low]) * (position - low);
+        }
+
+        function formatLatency(seconds) {
+            // Median and 90th percentile of the time spent per question
+            const sorted = [...seconds].sort((a, b) => a - b);
+            return `${Math.round(percentile(sorted, 50))}s · p90 ${Math.round(percentile(sorted, 90))}s`;
+        }
+
         function getElapsedTime() {
             if (state.startTime) {
                 return Math.floor((Date.now() - state.startTime) / 1000);
@@ -1769,14 +607,73 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             return state.timeRemaining || EXAM_TIME_LIMIT;
         }
 
-        // Shuffle array
-        function shuffle(array) {
-            const arr = [...array];
-            for (let i = arr.length - 1; i > 0; i--) {
-                const j = Math.floor(Math.random() * (i + 1));
-                [arr[i], arr[j]] = [arr[j], arr[i]];
+        // Server API
+        async function api(method, path, body) {
+            const options = { method, headers: {} };
+            if (body !== undefined) {
+                options.headers['Content-Type'] = 'application/json';
+                options.body = JSON.stringify(body);
+            }
+            const response = await fetch(path, options);
+            if (!response.ok) {
+                throw new Error(`${response.status} ${response.statusText}`);
+            }
+            return response.json();
+        }
+
+        async function startSession(params) {
+            const session = await api('POST', '/api/sessions', params);
+            state.sessionId = session.session;
+            state.shownIndex = -1;
+            state.currentQuestions = new Array(session.total).fill(null);
+            storeQuestions(session.session, session.offset, session.questions);
+        }
+
+        function storeQuestions(sessionId, offset, questions) {
+            // Ignore late responses for a session the user already left
+            if (state.sessionId !== sessionId) return;
+            questions.forEach((q, i) => {
+                if (!state.currentQuestions[offset + i]) {
+                    state.currentQuestions[offset + i] = q;
+                }
+            });
+        }
+
+        async function loadQuestions(offset, limit) {
+            const sessionId = state.sessionId;
+            while (limit > 0) {
+                const count = Math.min(limit, 100);
+                const page = await api('GET',
+                    `/api/sessions/${sessionId}/questions?offset=${offset}&limit=${count}`);
+                storeQuestions(sessionId, page.offset, page.questions);
+                offset += count;
+                limit -= count;
+            }
+        }
+
+        function prefetchQuestions() {
+            const next = state.currentQuestions.indexOf(null, state.currentIndex);
+            if (next !== -1 && next <= state.currentIndex + PREFETCH_AHEAD) {
+                loadQuestions(next, PREFETCH_WINDOW).catch(() => {});
             }
-            return arr;
+        }
+
+        async function ensureQuestion(index) {
+            if (!state.currentQuestions[index]) {
+                await loadQuestions(index, PREFETCH_WINDOW);
+            }
+            prefetchQuestions();
+        }
+
+        function sendAnswer(position, selected, latencyMs) {
+            return api('POST', `/api/sessions/${state.sessionId}/answers`,
+                { position, selected, latency_ms: latencyMs });
+        }
+
+        function applyAnswerKey(q, key) {
+            // The answer and explanation only reach the browser once answered
+            q.answer = key.answer;
+            q.explanation = key.explanation;
         }
 
         // Render functions
@@ -1792,6 +689,11 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                     break;
                 case 'question':
                     app.innerHTML = renderQuestion();
+                    // Time on a question runs from its first render to the submit
+                    if (state.shownIndex !== state.currentIndex) {
+                        state.shownIndex = state.currentIndex;
+                        state.shownAt = performance.now();
+                    }
                     break;
                 case 'result':
                     app.innerHTML = renderQuestionResult();
@@ -1806,7 +708,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         }
 
         function renderMenu() {
-            const totalQuestions = Object.values(questionsDB).reduce((sum, t) => sum + t.questions.length, 0);
+            const totalQuestions = Object.values(topicsCatalog).reduce((sum, t) => sum + t.count, 0);
 
             return `
                 <div class="header fade-in">
@@ -1836,14 +738,14 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         function renderTopics() {
             let topicsHTML = '';
 
-            for (const [key, topic] of Object.entries(questionsDB)) {
+            for (const [key, topic] of Object.entries(topicsCatalog)) {
                 const percentage = topic.percentage || '';
                 topicsHTML += `
                     <div class="topic-card" style="--topic-color: ${topic.color}" onclick="startPractice('${key}')">
                         <div class="icon">${topic.icon}</div>
                         <h3>${topic.name}</h3>
                         <p class="topic-percentage">${percentage}</p>
-                        <p>${topic.questions.length} preguntas</p>
+                        <p>${topic.count} preguntas</p>
                     </div>
                 `;
             }
@@ -2005,26 +907,33 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 
             // Calculate topic breakdown
             const topicStats = {};
+            const latencies = [];
             state.answers.forEach((answer, i) => {
                 const q = state.currentQuestions[i];
                 const topic = q.topicName || state.currentTopic;
                 if (!topicStats[topic]) {
-                    topicStats[topic] = { correct: 0, total: 0 };
+                    topicStats[topic] = { correct: 0, total: 0, latencies: [] };
                 }
                 topicStats[topic].total++;
                 if (answer.isCorrect) {
                     topicStats[topic].correct++;
                 }
+                if (answer.latency !== null) {
+                    topicStats[topic].latencies.push(answer.latency);
+                    latencies.push(answer.latency);
+                }
             });
 
             let topicBreakdownHTML = '';
             for (const [topic, stats] of Object.entries(topicStats)) {
                 const topicPct = Math.round((stats.correct / stats.total) * 100);
                 const scoreClass = topicPct >= 70 ? 'good' : 'bad';
+                const timing = stats.latencies.length ?
+                    ` <span class="topic-time">⏱ ${formatLatency(stats.latencies)}</span>` : '';
                 topicBreakdownHTML += `
                     <div class="topic-row">
                         <span>${topic}</span>
-                        <span class="topic-score ${scoreClass}">${stats.correct}/${stats.total} (${topicPct}%)</span>
+                        <span class="topic-score ${scoreClass}">${stats.correct}/${stats.total} (${topicPct}%)${timing}</span>
                     </div>
                 `;
             }
@@ -2054,6 +963,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                             <h4>Puntaje Requerido</h4>
                             <div class="value">70%</div>
                         </div>
+                        ${latencies.length ? `
+                            <div class="stat-card">
+                                <h4>Tiempo por Pregunta</h4>
+                                <div class="value">${formatLatency(latencies)}</div>
+                            </div>
+                        ` : ''}
                     </div>
 
                     ${state.isExamMode ? `
@@ -2135,6 +1050,8 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             stopTimer();
             state = {
                 screen: 'menu',
+                sessionId: null,
+                submitting: false,
                 currentQuestions: [],
                 currentIndex: 0,
                 score: 0,
@@ -2154,13 +1071,14 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             render();
         }
 
-        function startPractice(topicKey) {
-            const topic = questionsDB[topicKey];
-            state.currentQuestions = shuffle(topic.questions).map(q => ({
-                ...q,
-                topicName: topic.name,
-                topicColor: topic.color
-            }));
+        async function startPractice(topicKey) {
+            const topic = topicsCatalog[topicKey];
+            try {
+                await startSession({ mode: 'practice', topic: topicKey });
+            } catch (e) {
+                alert('No se pudo iniciar la práctica. Inténtalo de nuevo.');
+                return;
+            }
             state.currentTopic = topic.name;
             state.currentIndex = 0;
             state.score = 0;
@@ -2168,23 +1086,18 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             state.selectedOptions = [];
             state.isExamMode = false;
             state.screen = 'question';
+            prefetchQuestions();
             startTimer();
             render();
         }
 
-        function startExam(numQuestions) {
-            let allQuestions = [];
-            for (const [key, topic] of Object.entries(questionsDB)) {
-                topic.questions.forEach(q => {
-                    allQuestions.push({
-                        ...q,
-                        topicName: topic.name,
-                        topicColor: topic.color
-                    });
-                });
+        async function startExam(numQuestions) {
+            try {
+                await startSession({ mode: 'exam', count: numQuestions });
+            } catch (e) {
+                alert('No se pudo iniciar el examen. Inténtalo de nuevo.');
+                return;
             }
-
-            state.currentQuestions = shuffle(allQuestions).slice(0, numQuestions);
             state.currentTopic = 'Examen Simulado';
             state.currentIndex = 0;
             state.score = 0;
@@ -2192,6 +1105,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             state.selectedOptions = [];
             state.isExamMode = true;
             state.screen = 'question';
+            prefetchQuestions();
             startTimer();
             render();
         }
@@ -2218,29 +1132,36 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             }
         }
 
-        function submitAnswer() {
+        async function submitAnswer() {
             if (state.selectedOptions.length === 0) {
                 alert('Por favor selecciona una respuesta');
                 return;
             }
+            if (state.submitting) return;
 
             const q = state.currentQuestions[state.currentIndex];
-            let isCorrect;
-
-            if (q.type === 'multiple') {
-                const sorted1 = [...state.selectedOptions].sort();
-                const sorted2 = [...q.answer].sort();
-                isCorrect = sorted1.length === sorted2.length &&
-                           sorted1.every((v, i) => v === sorted2[i]);
-            } else {
-                isCorrect = state.selectedOptions[0] === q.answer;
+            const sessionId = state.sessionId;
+            const latencyMs = Math.round(performance.now() - state.shownAt);
+            state.submitting = true;
+            let result;
+            try {
+                const selected = q.type === 'multiple' ? [...state.selectedOptions] : state.selectedOptions[0];
+                result = await sendAnswer(state.currentIndex, selected, latencyMs);
+            } catch (e) {
+                alert('No se pudo enviar la respuesta. Inténtalo de nuevo.');
+                return;
+            } finally {
+                state.submitting = false;
             }
+            if (state.sessionId !== sessionId) return;
 
-            if (isCorrect) state.score++;
-
+            // Graded on the server; the response carries the running score
+            applyAnswerKey(q, result);
+            state.score = result.score;
             state.answers.push({
-                selected: q.type === 'multiple' ? [...state.selectedOptions] : state.selectedOptions[0],
-                isCorrect
+                selected: result.selected,
+                isCorrect: result.correct,
+                latency: latencyMs / 1000
             });
 
             if (state.isExamMode) {
@@ -2248,6 +1169,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                 if (state.currentIndex < state.currentQuestions.length - 1) {
                     state.currentIndex++;
                     state.selectedOptions = [];
+                    await ensureQuestion(state.currentIndex);
                     render();
                     updateTimer();
                 } else {
@@ -2261,10 +1183,11 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             }
         }
 
-        function nextQuestion() {
+        async function nextQuestion() {
             if (state.currentIndex < state.currentQuestions.length - 1) {
                 state.currentIndex++;
                 state.selectedOptions = [];
+                await ensureQuestion(state.currentIndex);
                 state.screen = 'question';
                 render();
             } else {
@@ -2311,54 +1234,955 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </html>
 '''
 
+class RenderedPage:
+    """A fully rendered response body, pre-encoded and pre-compressed"""
+    __slots__ = ('content_type', 'cache_control', 'body', 'variants', 'encodings',
+                 'etag', 'modified', 'last_modified')
+
+    def __init__(self, content_type, text, cache_control='no-cache'):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.body = text.encode('utf-8')
+        self.variants = {}
+        if len(self.body) >= COMPRESSION_MIN_SIZE:
+            # mtime=0 keeps the gzip variant byte-identical across rebuilds
+            for encoding, compressed in (('gzip', gzip.compress(self.body, 9, mtime=0)),
+                                         ('deflate', zlib.compress(self.body, 9))):
+                if len(compressed) < len(self.body):
+                    self.variants[encoding] = compressed
+        self.encodings = tuple(self.variants)
+        # Weak validator: the compressed variants are semantically the same body
+        self.etag = 'W/"%s"' % hashlib.sha256(self.body).hexdigest()[:32]
+        self.modified = int(time.time())
+        self.last_modified = formatdate(self.modified, usegmt=True)
+
+    def variant(self, encoding):
+        """Returns the body for a content coding (None means identity)"""
+        if encoding is None:
+            return self.body
+        return self.variants[encoding]
+
+    def matches(self, if_none_match, if_modified_since):
+        """Evaluates conditional request headers; True means 304 Not Modified"""
+        if if_none_match is not None:
+            # If-None-Match wins over If-Modified-Since (RFC 7232, section 6)
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            if '*' in tags:
+                return True
+            return any(_opaque_tag(tag) == _opaque_tag(self.etag) for tag in tags)
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since is None or since.tzinfo is None:
+                return False
+            return self.modified <= since.timestamp()
+        return False
+
+
+def _opaque_tag(tag):
+    """Strips the weak prefix so ETags compare with the weak comparison function"""
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def topics_catalog():
+    """Topic metadata and question counts; questions are fetched per session"""
+    return {
+        topic_key: {
+            'name': topic.name,
+            'percentage': topic.percentage,
+            'icon': topic.icon,
+            'color': topic.color,
+            'count': len(topic.questions),
+        }
+        for topic_key, topic in BANK.topics.items()
+    }
+
+
+def render_index():
+    """Renders the single page app with the topic catalog embedded"""
+    html = HTML_TEMPLATE.replace(
+        'TOPICS_DATA_PLACEHOLDER',
+        json.dumps(topics_catalog(), ensure_ascii=False)
+    )
+    # The catalog reflects the bank, so browsers must revalidate it on every load
+    return RenderedPage('text/html; charset=utf-8', html, 'no-cache')
+
+
+def public_question(question, fields=QUESTION_FIELDS):
+    """The requested public fields of a question (never its answer or explanation)"""
+    return {name: getattr(question, name) for name in fields}
+
+
+def render_questions_api():
+    """Serializes the question bank, without answers, for /api/questions"""
+    topics = {}
+    for key, topic in BANK.topics.items():
+        topics[key] = {
+            'name': topic.name,
+            'percentage': topic.percentage,
+            'icon': topic.icon,
+            'color': topic.color,
+            'questions': [public_question(q, QUESTION_FIELDS[1:]) for q in topic.questions],
+        }
+    return RenderedPage('application/json; charset=utf-8',
+                        json.dumps(topics, ensure_ascii=False),
+                        API_CACHE_CONTROL)
+
+
+class QuestionIndex:
+    """Web-specific views of the bank, precomputed once per bank version"""
+
+    def __init__(self, bank):
+        # What a candidate may see before answering: no answer, no explanation
+        self.public = {}
+        for q in bank:
+            topic = bank.topics[q.topic]
+            self.public[q.key] = {
+                'key': q.key,
+                'topic': q.topic,
+                'topicName': topic.name,
+                'topicColor': topic.color,
+                'id': q.id,
+                'type': q.type,
+                'question': q.question,
+                'options': q.options,
+            }
+
+
+class RenderCache:
+    """Holds rendered pages, rebuilding them only when the bank version changes"""
+
+    def __init__(self, renderers):
+        self._renderers = renderers
+        self._pages = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        if self._version != BANK.version:
+            self.rebuild()
+        return self._pages[name]
+
+    def rebuild(self):
+        with self._lock:
+            version = BANK.version
+            if self._version == version:
+                return
+            self._pages = {name: render() for name, render in self._renderers.items()}
+            self._version = version
+
+
+_bank_checked = 0.0
+_bank_lock = threading.Lock()
+
+
+def refresh_bank():
+    """Reloads the bank if its file changed; the caches keyed on BANK.version follow"""
+    global _bank_checked
+    if time.monotonic() - _bank_checked < BANK_CHECK_INTERVAL:
+        return
+    with _bank_lock:
+        if time.monotonic() - _bank_checked < BANK_CHECK_INTERVAL:
+            return
+        _bank_checked = time.monotonic()
+        try:
+            BANK.reload()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Keep serving the last good bank while the file is being edited
+            print(f"⚠️  No se pudo recargar el banco: {e}")
+
+
+PAGE_CACHE = RenderCache({
+    'index': render_index,
+    'questions': render_questions_api,
+    'question_index': lambda: QuestionIndex(BANK),
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _render_question_page(version, topic, offset, limit, fields):
+    selected = BANK.questions if topic is None else BANK.by_topic[topic]
+    window = selected[offset:offset + limit]
+    window = [public_question(q, fields or QUESTION_FIELDS) for q in window]
+    page = {
+        'total': len(selected),
+        'offset': offset,
+        'limit': limit,
+        'questions': window,
+    }
+    return RenderedPage('application/json; charset=utf-8',
+                        json.dumps(page, ensure_ascii=False),
+                        API_CACHE_CONTROL)
+
+
+def parse_question_query(query):
+    """Validates /api/questions parameters, raising ValueError with a message"""
+    params = parse_qs(query, keep_blank_values=True)
+    for name in params:
+        if name not in ('topic', 'offset', 'limit', 'fields'):
+            raise ValueError(f"Unknown parameter: {name}")
+
+    topic = params.get('topic', [None])[-1]
+    if topic is not None and topic not in BANK.topics:
+        raise ValueError(f"Unknown topic: {topic}")
+
+    try:
+        offset = int(params.get('offset', ['0'])[-1])
+        limit = int(params.get('limit', [str(API_PAGE_SIZE)])[-1])
+    except ValueError:
+        raise ValueError("offset and limit must be integers") from None
+    if offset < 0 or not 1 <= limit <= API_MAX_PAGE_SIZE:
+        raise ValueError(f"offset must be >= 0 and limit between 1 and {API_MAX_PAGE_SIZE}")
+
+    fields = None
+    if 'fields' in params:
+        fields = tuple(name.strip() for name in params['fields'][-1].split(',') if name.strip())
+        unknown = [name for name in fields if name not in QUESTION_FIELDS]
+        if unknown or not fields:
+            raise ValueError(f"fields must be a subset of: {', '.join(QUESTION_FIELDS)}")
+
+    return topic, offset, limit, fields
+
+
+def question_page(query):
+    """Returns the cached page of /api/questions for a query string"""
+    topic, offset, limit, fields = parse_question_query(query)
+    return _render_question_page(BANK.version, topic, offset, limit, fields)
+
+SEARCH_INDEX = SearchIndex()
+
+
+def search_questions(query):
+    """Ranked /api/search results (without answers) for a query string"""
+    params = parse_qs(query)
+    text = params.get('q', [''])[-1].strip()
+    if not text:
+        raise ValueError("q is required")
+    try:
+        limit = int(params.get('limit', [str(SEARCH_PAGE_SIZE)])[-1])
+    except ValueError:
+        raise ValueError("limit must be an integer") from None
+    if not 1 <= limit <= API_MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {API_MAX_PAGE_SIZE}")
+
+    SEARCH_INDEX.sync(BANK)
+    results = SEARCH_INDEX.search(text, limit)
+    return {
+        'query': text,
+        'total': len(results),
+        'results': [{
+            'key': question.key,
+            'topic': question.topic,
+            'topicName': BANK.topics[question.topic].name,
+            'score': round(score, 4),
+            'snippet': snippet(question, text),
+        } for question, score in results],
+    }
+
+ROUTES = {
+    '/': 'index',
+    '/index.html': 'index',
+    '/api/questions': 'questions',
+    '/api/search': 'search',
+    '/api/stats': 'stats',
+}
+
+
+@functools.lru_cache(maxsize=128)
+def choose_encoding(accept_encoding, available):
+    """Picks the best of the available codings for an Accept-Encoding header.
+
+    Codings are weighed by their q-values (RFC 7231, section 5.3.4); ties go
+    to the order of ``available``. None means send the identity body.
+    """
+    qvalues = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in available:
+        q = qvalues.get(coding, qvalues.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionStats:
+    """Per-route counters of bytes saved by serving compressed variants"""
+
+    def __init__(self):
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def record(self, route, identity_size, sent_size):
+        with self._lock:
+            stats = self._routes.setdefault(route, {'responses': 0, 'compressed': 0, 'bytes_saved': 0})
+            stats['responses'] += 1
+            if sent_size < identity_size:
+                stats['compressed'] += 1
+                stats['bytes_saved'] += identity_size - sent_size
+
+    def snapshot(self):
+        with self._lock:
+            return {route: dict(stats) for route, stats in self._routes.items()}
+
+
+COMPRESSION_STATS = CompressionStats()
+
+
+class SessionStore:
+    """Exam sessions held in this process's memory.
+
+    A session is a plain JSON-compatible dict; ``update`` applies a change
+    atomically so concurrent requests for one session cannot interleave.
+    """
+
+    def __init__(self, ttl=SESSION_TTL, limit=SESSION_LIMIT):
+        self.ttl = ttl
+        self.limit = limit
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def create(self, session):
+        session_id = secrets.token_urlsafe(16)
+        with self._lock:
+            self._expire(time.time())
+            self._sessions[session_id] = session
+        return session_id
+
+    def get(self, session_id):
+        """Returns the session (KeyError when unknown or expired)"""
+        with self._lock:
+            return self._live(session_id)
+
+    def update(self, session_id, change):
+        """Runs change(session) under the store lock and returns its result"""
+        with self._lock:
+            return change(self._live(session_id))
+
+    def _live(self, session_id):
+        session = self._sessions[session_id]
+        if time.time() - session['created'] >= self.ttl:
+            del self._sessions[session_id]
+            raise KeyError(session_id)
+        return session
+
+    def _expire(self, now):
+        # Dicts keep insertion order, so the oldest sessions come first
+        while self._sessions:
+            oldest = next(iter(self._sessions))
+            if len(self._sessions) < self.limit and now - self._sessions[oldest]['created'] < self.ttl:
+                break
+            del self._sessions[oldest]
+
+
+class SqliteSessionStore(SessionStore):
+    """Exam sessions in a SQLite file, shared by every prefork worker"""
+
+    def __init__(self, path, ttl=SESSION_TTL, limit=SESSION_LIMIT):
+        super().__init__(ttl, limit)
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS sessions '
+                         '(id TEXT PRIMARY KEY, created REAL NOT NULL, data TEXT NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS sessions_created ON sessions (created)')
+
+    def _connect(self):
+        # One connection per thread; opened lazily so forked workers get their own
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def create(self, session):
+        session_id = secrets.token_urlsafe(16)
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM sessions WHERE created <= ?', (time.time() - self.ttl,))
+            # Like the in-memory store, drop the oldest sessions to stay within the limit
+            conn.execute('DELETE FROM sessions WHERE id IN '
+                         '(SELECT id FROM sessions ORDER BY created DESC LIMIT -1 OFFSET ?)',
+                         (max(self.limit - 1, 0),))
+            conn.execute('INSERT INTO sessions VALUES (?, ?, ?)',
+                         (session_id, session['created'], json.dumps(session)))
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return session_id
+
+    def get(self, session_id):
+        row = self._connect().execute('SELECT data FROM sessions WHERE id = ? AND created > ?',
+                                      (session_id, time.time() - self.ttl)).fetchone()
+        if row is None:
+            raise KeyError(session_id)
+        return json.loads(row[0])
+
+    def update(self, session_id, change):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT data FROM sessions WHERE id = ? AND created > ?',
+                               (session_id, time.time() - self.ttl)).fetchone()
+            if row is None:
+                raise KeyError(session_id)
+            session = json.loads(row[0])
+            result = change(session)
+            conn.execute('UPDATE sessions SET data = ? WHERE id = ?',
+                         (json.dumps(session), session_id))
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        return result
+
+
+# Replaced by a SqliteSessionStore when running in prefork mode
+SESSIONS = SessionStore()
+
+# Set from --attempts-db; None means WEB_ATTEMPTS_DB in the user's data folder
+ATTEMPTS_PATH = None
+
+_attempts = None
+_attempts_lock = threading.Lock()
+
+
+def attempt_log():
+    """This process's answer log (opened lazily so prefork workers get their own)"""
+    global _attempts
+    with _attempts_lock:
+        if _attempts is None or _attempts[0] != os.getpid():
+            try:
+                log = AttemptLog(ATTEMPTS_PATH or user_data_path(WEB_ATTEMPTS_DB))
+            except (OSError, sqlite3.Error):
+                log = AttemptLog(':memory:')
+            _attempts = (os.getpid(), log)
+        return _attempts[1]
+
+
+def flush_attempt_log():
+    """Writes any buffered answers before the process exits"""
+    if _attempts is not None and _attempts[0] == os.getpid():
+        _attempts[1].flush()
+
+
+def create_session(params):
+    """Draws the question set for a new exam or practice session"""
+    mode = params.get('mode')
+    if mode == 'exam':
+        count = params.get('count')
+        if type(count) is not int or count < 1:
+            raise ValueError("count must be a positive integer")
+        # An optional seed makes the exam reproducible (same seed, same questions)
+        seed = params.get('seed')
+        if seed is not None and type(seed) is not int:
+            raise ValueError("seed must be an integer")
+        drawn = BANK.sample_exam(count, random.Random(seed) if seed is not None else None)
+    elif mode == 'practice':
+        topic = params.get('topic')
+        # Lists and objects can't be looked up (unhashable): reject them first
+        if not isinstance(topic, str) or topic not in BANK.by_topic:
+            raise ValueError(f"Unknown topic: {topic}")
+        drawn = random.sample(BANK.by_topic[topic], len(BANK.by_topic[topic]))
+    else:
+        raise ValueError("mode must be 'exam' or 'practice'")
+
+    session = {
+        'mode': mode,
+        'created': time.time(),
+        'keys': [q.key for q in drawn],
+        'answers': {},
+        'score': 0,
+        # Opened with the first real answer, so sessions nobody answers leave no trace
+        'log': None,
+    }
+    session_id = SESSIONS.create(session)
+    return {
+        'session': session_id,
+        'total': len(session['keys']),
+        'offset': 0,
+        'questions': session_questions(session, 0, SESSION_PREFETCH),
+    }
+
+
+def session_questions(session, offset, limit):
+    """Public (answer-free) payloads for a window of a session's questions"""
+    public = PAGE_CACHE.get('question_index').public
+    return [dict(public[key], position=position)
+            for position, key in enumerate(session['keys'][offset:offset + limit], offset)]
+
+
+def session_review(session):
+    """Answers, explanations and verdicts of a finished session (None while unfinished)"""
+    keys = session['keys']
+    if len(session['answers']) < len(keys):
+        return None
+    questions = []
+    for position, key in enumerate(keys):
+        question = BANK.by_key[key]
+        selected, correct, *_ = session['answers'][str(position)]
+        questions.append({
+            'position': position,
+            'key': key,
+            'selected': selected,
+            'correct': correct,
+            'answer': question.answer,
+            'explanation': question.explanation,
+        })
+    return {'score': session['score'], 'total': len(keys), 'questions': questions}
+
+
+def parse_window(query):
+    params = parse_qs(query)
+    try:
+        offset = int(params.get('offset', ['0'])[-1])
+        limit = int(params.get('limit', [str(SESSION_PREFETCH)])[-1])
+    except ValueError:
+        raise ValueError("offset and limit must be integers") from None
+    if offset < 0 or not 1 <= limit <= API_MAX_PAGE_SIZE:
+        raise ValueError(f"offset must be >= 0 and limit between 1 and {API_MAX_PAGE_SIZE}")
+    return offset, limit
+
+
+def validate_selection(question, selected):
+    """Checks that a submitted selection fits the question (None means unanswered)"""
+    if selected is None:
+        return None
+    valid = range(len(question.options))
+    if question.is_multiple:
+        if (not isinstance(selected, list) or not selected
+                or not all(type(i) is int and i in valid for i in selected)):
+            raise ValueError("selected must be a non-empty list of option indices")
+        return sorted(set(selected))
+    if type(selected) is not int or selected not in valid:
+        raise ValueError("selected must be an option index")
+    return selected
+
+
+def validate_latency(latency_ms):
+    """Client-measured time on the question in ms (optional) -> seconds"""
+    if latency_ms is None:
+        return None
+    if (isinstance(latency_ms, bool) or not isinstance(latency_ms, (int, float))
+            or not 0 <= latency_ms <= MAX_LATENCY_MS):
+        raise ValueError(f"latency_ms must be a number between 0 and {MAX_LATENCY_MS}")
+    return latency_ms / 1000
+
+
+def grade_answers(session_id, params):
+    """Grades one answer ({position, selected, latency_ms}) or a batch ({answers: [...]}).
+
+    Each graded answer reveals its key and explanation. The first submission
+    for a position is final; repeating it returns the recorded verdict. The
+    whole batch is validated before anything is recorded.
+    """
+    batch = params.get('answers', [params]) if 'answers' in params else [params]
+    if not isinstance(batch, list) or not 1 <= len(batch) <= MAX_ANSWER_BATCH:
+        raise ValueError(f"answers must be a list of 1 to {MAX_ANSWER_BATCH} items")
+    def record(session):
+        keys = session['keys']
+        checked = []
+        for item in batch:
+            if not isinstance(item, dict):
+                raise ValueError("each answer must be an object")
+            position = item.get('position')
+            # type() rather than isinstance(): JSON true/false must not pass as 1/0
+            if type(position) is not int or not 0 <= position < len(keys):
+                raise ValueError("position out of range")
+            key = keys[position]
+            question = BANK.by_key[key]
+            checked.append((position, question, validate_selection(question, item.get('selected')),
+                            validate_latency(item.get('latency_ms'))))
+
+        answers = session['answers']
+        graded = []
+        new = []
+        for position, question, selected, latency in checked:
+            slot = str(position)
+            if slot not in answers:
+                mask = indices_mask(selected)
+                correct = grade(question, mask)
+                answers[slot] = [selected, correct, latency]
+                session['score'] += correct
+                new.append((question, mask, correct, latency))
+            graded.append((position, question, answers[slot]))
+        if session.get('log') is None and any(mask for _, mask, _, _ in new):
+            session['log'] = attempt_log().start_session(session['mode'], 'web')
+        return graded, new, session.get('log'), session['score'], len(answers), len(keys)
+
+    graded, new, log_session, score, answered, total = SESSIONS.update(session_id, record)
+    if log_session is not None:
+        log = attempt_log()
+        for question, mask, correct, latency in new:
+            # Unanswered questions (timed out) are not attempts
+            if mask:
+                log.record(log_session, question, mask, correct, latency)
+        if new and answered == total:
+            log.finish_session(log_session, score, total)
+
+    results = []
+    for position, question, (selected, correct, *_) in graded:
+        results.append({
+            'position': position,
+            'selected': selected,
+            'correct': correct,
+            'answer': question.answer,
+            'explanation': question.explanation,
+        })
+    summary = {'score': score, 'answered': answered, 'total': total}
+    if 'answers' in params:
+        return dict(summary, results=results)
+    return dict(results[0], **summary)
+
+
 class ExamHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/' or self.path == '/index.html':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
+    # Drop idle or stalled clients instead of letting them pin a worker
+    timeout = 30
 
-            # Inject questions data
-            html = HTML_TEMPLATE.replace(
-                'QUESTIONS_DATA_PLACEHOLDER',
-                json.dumps(QUESTIONS_DB, ensure_ascii=False)
-            )
-            self.wfile.write(html.encode('utf-8'))
-        elif self.path == '/api/questions':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(QUESTIONS_DB).encode())
-        else:
+    def do_GET(self):
+        refresh_bank()
+        url = urlparse(self.path)
+        route = ROUTES.get(url.path)
+        if route is None:
+            match = SESSION_PATH.match(url.path)
+            if match and match.group(2) == 'questions':
+                self.handle_session_get(match.group(1), url.query)
+                return
+            if match and match.group(2) == 'review':
+                self.handle_session_review(match.group(1))
+                return
             self.send_error(404)
+            return
+
+        if route == 'stats':
+            self.send_json(COMPRESSION_STATS.snapshot())
+            return
+
+        if route == 'search':
+            try:
+                self.send_json(search_questions(url.query))
+            except ValueError as e:
+                self.send_error(400, str(e))
+            return
+
+        if route == 'questions' and url.query:
+            try:
+                page = question_page(url.query)
+            except ValueError as e:
+                self.send_error(400, str(e))
+                return
+            self.send_page(route, page)
+            return
+
+        self.send_page(route, PAGE_CACHE.get(route))
+
+    def do_POST(self):
+        refresh_bank()
+        url = urlparse(self.path)
+        try:
+            if url.path == '/api/sessions':
+                self.send_json(create_session(self.read_json()), status=201)
+                return
+            match = SESSION_PATH.match(url.path)
+            if match and match.group(2) == 'answers':
+                self.send_json(grade_answers(match.group(1), self.read_json()))
+                return
+        except KeyError:
+            self.send_error(404, "Unknown session")
+            return
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_error(404)
+
+    def handle_session_get(self, session_id, query):
+        try:
+            offset, limit = parse_window(query)
+            session = SESSIONS.get(session_id)
+        except KeyError:
+            self.send_error(404, "Unknown session")
+            return
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+        self.send_json({
+            'total': len(session['keys']),
+            'offset': offset,
+            'questions': session_questions(session, offset, limit),
+        })
+
+    def handle_session_review(self, session_id):
+        try:
+            review = session_review(SESSIONS.get(session_id))
+        except KeyError:
+            self.send_error(404, "Unknown session")
+            return
+        if review is None:
+            self.send_error(409, "Session not finished")
+            return
+        # send_json marks it no-store: the key is only for this session's owner
+        self.send_json(review)
+
+    def read_json(self):
+        """Parses a JSON object request body, raising ValueError when malformed"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise ValueError("Invalid Content-Length") from None
+        # A negative length would make rfile.read() wait for the client to close
+        if length < 0:
+            raise ValueError("Invalid Content-Length")
+        if length > MAX_REQUEST_BODY:
+            raise ValueError("Request body too large")
+        try:
+            data = json.loads(self.rfile.read(length) or b'{}')
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError("Request body must be JSON") from None
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def send_json(self, data, status=200):
+        """Writes a small, uncached JSON response"""
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_page(self, route, page):
+        """Writes a cached page, answering 304 when the client copy is current"""
+        if page.matches(self.headers.get('If-None-Match'),
+                        self.headers.get('If-Modified-Since')):
+            self.send_response(304)
+            self.send_validators(page)
+            self.end_headers()
+            return
+
+        encoding = choose_encoding(self.headers.get('Accept-Encoding', ''), page.encodings)
+        body = page.variant(encoding)
+        COMPRESSION_STATS.record(route, len(page.body), len(body))
+
+        self.send_response(200)
+        self.send_header('Content-type', page.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_validators(page)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_validators(self, page):
+        self.send_header('ETag', page.etag)
+        self.send_header('Last-Modified', page.last_modified)
+        self.send_header('Cache-Control', page.cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
 
     def log_message(self, format, *args):
         pass  # Suppress logging
 
+
+class ExamServer(socketserver.TCPServer):
+    """Single-threaded TCP server with a listen backlog sized for a classroom"""
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class ThreadPoolServer(ExamServer):
+    """TCP server that hands each connection to a fixed pool of worker threads"""
+
+    def __init__(self, server_address, handler_class, workers=DEFAULT_THREADS):
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='az104-http')
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Let in-flight requests finish before the process exits
+        self._pool.shutdown(wait=True)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _serve_until_signalled(httpd):
+    """Runs serve_forever in a thread until SIGTERM arrives, then drains it"""
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent handles Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    loop = threading.Thread(target=httpd.serve_forever)
+    loop.start()
+    stop.wait()
+    httpd.shutdown()
+    loop.join()
+    httpd.server_close()
+    flush_attempt_log()
+
+
+def _spawn_worker(httpd):
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _serve_until_signalled(httpd)
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve_prefork(httpd, workers):
+    """Forks worker processes that all accept() on the already bound socket.
+
+    Crashed workers are replaced, waiting longer after each one that dies right
+    after starting and giving up after WORKER_MAX_CRASHES of those in a row.
+    Ctrl+C or SIGTERM on the parent asks every worker to finish its current
+    request and exit.
+    """
+    started = {}
+    for _ in range(workers):
+        started[_spawn_worker(httpd)] = time.monotonic()
+    crashes = 0
+    try:
+        while started:
+            pid, _ = os.wait()
+            uptime = time.monotonic() - started.pop(pid, 0)
+            crashes = crashes + 1 if uptime < WORKER_MIN_UPTIME else 0
+            if crashes >= WORKER_MAX_CRASHES:
+                print(f"\n⚠️  Los workers fallan al arrancar ({crashes} seguidos); deteniendo el servidor.")
+                break
+            if crashes:
+                time.sleep(WORKER_RESPAWN_DELAY * 2 ** (crashes - 1))
+            started[_spawn_worker(httpd)] = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # A second Ctrl+C or SIGTERM must not interrupt the drain
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        children = list(started)
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        httpd.server_close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor web del simulador AZ-104")
+    parser.add_argument('--mode', choices=SERVER_MODES, default='threads',
+                        help="single: un solo hilo; threads: pool de hilos; "
+                             "prefork: varios procesos sobre el mismo socket")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="hilos (threads) o procesos (prefork) a usar")
+    parser.add_argument('--attempts-db', metavar='ARCHIVO',
+                        help=f"historial de las respuestas web (por defecto, {WEB_ATTEMPTS_DB} "
+                             "en la carpeta de datos)")
+    args = parser.parse_args(argv)
+    if args.mode == 'prefork' and not hasattr(os, 'fork'):
+        print("⚠️  El modo prefork no está disponible en este sistema; usando threads.")
+        args.mode = 'threads'
+    if args.workers is None:
+        args.workers = (os.cpu_count() or 2) if args.mode == 'prefork' else DEFAULT_THREADS
+    if args.workers < 1:
+        parser.error("--workers debe ser al menos 1")
+    return args
+
+
 def open_browser():
     """Opens the browser after a short delay"""
     import time
     time.sleep(1)
     webbrowser.open(f'http://localhost:{PORT}')
 
-def main():
+def main(argv=None):
+    global ATTEMPTS_PATH
+    args = parse_args(argv)
+    ATTEMPTS_PATH = args.attempts_db
+
     print("=" * 60)
     print("  AZ-104 - Simulador de Examen de Certificación")
     print("=" * 60)
     print(f"\n🚀 Iniciando servidor en http://localhost:{PORT}")
+    if args.mode != 'single':
+        print(f"   Modo: {args.mode} ({args.workers} workers)")
     print("\n📌 La aplicación se abrirá automáticamente en tu navegador.")
     print("   Si no se abre, visita: http://localhost:8080")
     print("\n⏹️  Presiona Ctrl+C para detener el servidor.\n")
 
+    # Render the page once up front so the first visitor doesn't pay for it
+    # (and, in prefork mode, so every worker inherits the rendered buffers)
+    PAGE_CACHE.rebuild()
+
     # Open browser in a separate thread
     threading.Thread(target=open_browser, daemon=True).start()
 
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer(("", PORT), ExamHandler) as httpd:
+    # Treat SIGTERM like Ctrl+C so in-flight requests are drained either way
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+    if args.mode == 'threads':
+        httpd = ThreadPoolServer(("", PORT), ExamHandler, workers=args.workers)
+    else:
+        httpd = ExamServer(("", PORT), ExamHandler)
+
+    if args.mode == 'prefork':
+        # Workers don't share memory, so exam sessions live in a shared SQLite file
+        global SESSIONS
+        session_dir = tempfile.mkdtemp(prefix='az104-sessions-')
+        SESSIONS = SqliteSessionStore(os.path.join(session_dir, 'sessions.sqlite3'))
+        try:
+            serve_prefork(httpd, args.workers)
+        finally:
+            shutil.rmtree(session_dir, ignore_errors=True)
+        print("\n\n👋 ¡Hasta luego! Servidor detenido.")
+        return
+
+    with httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n\n👋 ¡Hasta luego! Servidor detenido.")
+    flush_attempt_log()
 
 if __name__ == "__main__":
     main()